@@ -0,0 +1,110 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# ==========================================================
+# EXECUTOR DOS EXPERIMENTOS
+# ==========================================================
+# Roda as questões pela linha de comando, uma a uma ou todas juntas:
+#
+#   python executar.py questao4
+#   python executar.py todos --graficos arquivo --processos 4
+#
+# Cada script expõe executar(), que imprime as tabelas e devolve as figuras
+# (só dados, ver raizes/graficos.py); o matplotlib só é importado quando há
+# gráficos a desenhar. Com --processos > 1 os experimentos rodam em processos
+# separados e a saída de cada um é impressa inteira, na ordem pedida.
+# Com --cache, resultados já calculados (mesmas funções, métodos, parâmetros
+# e precisão) são lidos de resultados/cache em vez de refeitos; os tempos do
+# benchmark são sempre medidos de novo, nesta máquina. Ver raizes/cache.py.
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+EXPERIMENTOS = {
+    "questao1": "questao1.py",
+    "questao2": "questao2.py",
+    "questao3.funcao1": "questao3.funcao1.py",
+    "questao3.funcao2": "questao3.funcao2.py",
+    "questao4": "questao4.py",
+    "questao5": "questao5.py",
+}
+
+
+def _carregar(nome):
+    # os nomes dos arquivos têm pontos, então não dá para usar import direto
+    caminho = os.path.join(PASTA, EXPERIMENTOS[nome])
+    spec = importlib.util.spec_from_file_location(nome.replace(".", "_"), caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def _ativar_cache(config):
+    if config is not None:
+        from raizes import cache
+        cache.ativar(*config)
+
+
+def _rodar(nome):
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        figuras = _carregar(nome).executar()
+    return saida.getvalue(), figuras
+
+
+def executar(nomes, processos=1, cache=None):
+    # cache: None ou (pasta, limite em bytes)
+    if processos == 1 or len(nomes) <= 1:
+        _ativar_cache(cache)
+        for nome in nomes:
+            yield nome, _carregar(nome).executar()
+        return
+    with ProcessPoolExecutor(max_workers=processos, initializer=_ativar_cache, initargs=(cache,)) as executor:
+        for nome, (texto, figuras) in zip(nomes, executor.map(_rodar, nomes)):
+            print(texto, end="")
+            yield nome, figuras
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa os experimentos da lista 1.")
+    parser.add_argument("experimentos", nargs="+", choices=[*EXPERIMENTOS, "todos"])
+    parser.add_argument("--graficos", choices=["nenhum", "janela", "arquivo"], default="nenhum",
+                        help="não desenhar, abrir janelas ou salvar em --pasta (padrão: nenhum)")
+    parser.add_argument("--pasta", default="resultados/graficos")
+    parser.add_argument("--processos", type=int, default=1,
+                        help="processos em paralelo; 0 usa todos os núcleos (padrão: 1)")
+    parser.add_argument("--cache", nargs="?", const="resultados/cache", default=None, metavar="PASTA",
+                        help="reaproveitar resultados já calculados (padrão da pasta: resultados/cache)")
+    parser.add_argument("--cache-limite", type=float, default=256,
+                        help="tamanho máximo do cache em MB (padrão: 256)")
+    args = parser.parse_args(argv)
+
+    nomes = list(EXPERIMENTOS) if "todos" in args.experimentos else list(dict.fromkeys(args.experimentos))
+    processos = args.processos or os.cpu_count()
+
+    # os scripts importam raizes e gravam em resultados/ relativo à raiz do repositório
+    os.chdir(PASTA)
+    if PASTA not in sys.path:
+        sys.path.insert(0, PASTA)
+
+    figuras = []
+    cache = (args.cache, int(args.cache_limite * 2**20)) if args.cache else None
+    for nome, figuras_experimento in executar(nomes, processos, cache):
+        figuras.extend(figuras_experimento)
+
+    if args.graficos == "nenhum":
+        return
+    from raizes import graficos
+    if args.graficos == "janela":
+        graficos.mostrar(figuras)
+    else:
+        for caminho in graficos.salvar(figuras, args.pasta, processos):
+            print("Gráfico salvo em " + caminho)
+
+
+if __name__ == "__main__":
+    main()
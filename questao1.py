@@ -0,0 +1,68 @@
+import sys
+
+import numpy as np
+
+from raizes import cache, graficos
+from raizes.pontoflutuante import TIPOS, SONDAS, parametros, erros, perfil
+
+# ==========================================================
+# PONTO FLUTUANTE (versão em Python de questao1cn.m)
+# ==========================================================
+# realmax, realmin e eps de cada tipo, a expressão ((1+x)-1)/x nos dois
+# valores do enunciado e, para ter o perfil completo e não só duas amostras,
+# cada sonda de cancelamento varrida em PONTOS valores de x (escala log)
+# para float16, float32, float64 e longdouble.
+
+PONTOS = 1_000_000
+EXPOENTES = (-20, 20)
+
+
+def executar():
+    print("========================")
+    print(" #RealmaxRealminEps")
+    print("========================")
+    print(f"  {'tipo':<11}{'realmax':>26}{'realmin':>26}{'eps':>26}")
+    for tipo in TIPOS:
+        p = parametros(tipo)
+        # format_float_scientific: o f-string passaria por float64 e o longdouble estouraria
+        print(f"  {tipo:<11}" + "".join(np.format_float_scientific(p[chave], precision=16, unique=False).rjust(26)
+                                        for chave in ("realmax", "realmin", "eps")))
+
+    print("\n========================")
+    print(" #AvaliacaoDaExpressao")
+    print("========================")
+    xs = [1e-15, 1e15]
+    aproximado, erro_abs, erro_rel, erro_ulp = erros("((1+x)-1)/x", "float64", xs)
+    for i, x in enumerate(xs):
+        print(f"x = {x:.1e}  -> f_aprox = {aproximado[i]:.16e} | erro absoluto = {erro_abs[i]:.16e} | "
+              f"erro relativo = {erro_rel[i]:.16e} | ULPs = {erro_ulp[i]:.3g}")
+
+    print("\n========================")
+    print(f" #PerfilDeErro ({PONTOS} pontos, x de 1e{EXPOENTES[0]} a 1e{EXPOENTES[1]})")
+    print("========================")
+    paineis = []
+    for sonda in SONDAS:
+        print(f"\n--- {sonda} ---")
+        series = {}
+        for tipo in TIPOS:
+            r = cache.chamar(perfil, sonda, tipo, *EXPOENTES, pontos=PONTOS)
+            ruins = r["log10_x"][r["erro_rel"] > 0.01]
+            faixa = f"1e{ruins.min():.1f} a 1e{ruins.max():.1f}" if ruins.size else "nunca"
+            print(f"{tipo:<11} erro relativo máx: {np.nanmax(r['erro_rel']):.3e} | ULPs máx: "
+                  f"{np.nanmax(r['erro_ulp']):.3e} | erro > 1% para x de {faixa}")
+            # erros abaixo de 1e-20 (inclusive zero) aparecem como 1e-20 na escala log
+            series[tipo] = (r["log10_x"], np.maximum(r["erro_rel"], 1e-20))
+        paineis.append((sonda, series))
+
+    figuras = [graficos.figura("questao1.png", "Erro relativo máximo por faixa de x", paineis,
+                               xlabel="log10(x)", ylabel="Erro relativo", log=True)]
+    return figuras
+
+
+if __name__ == "__main__":
+    # com --salvar, os gráficos são gravados em resultados/graficos sem abrir janelas
+    figuras = executar()
+    if "--salvar" in sys.argv:
+        graficos.salvar(figuras)
+    else:
+        graficos.mostrar(figuras)
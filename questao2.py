@@ -0,0 +1,64 @@
+import sys
+
+import numpy as np
+
+from raizes import cache, graficos
+from raizes.compensado import COEFICIENTES_QUESTAO2, horner, horner_compensado, fatorada, estudo_cancelamento
+
+# ==========================================================
+# CANCELAMENTO EM (x - 1)^7 (versão em Python de questao2.m)
+# ==========================================================
+# Forma expandida x^7 - 7x^6 + 21x^5 - 35x^4 + 35x^3 - 21x^2 + 7x - 1
+# avaliada por Horner comum e por Horner compensado, contra a forma
+# reescrita (x - 1)^7 (mais estável).
+
+a = 1 - 2e-8
+b = 1 + 2e-8
+n = 401
+
+# a mesma comparação numa malha bem mais fina, avaliada em blocos
+N_GRANDE = 10_000_000
+
+
+def imprimir_maximos(maximos):
+    print(f"max |f_expand|     = {maximos['expandida']:.3e}")
+    print(f"max |f_compensada| = {maximos['compensada']:.3e}")
+    print(f"max |f_estavel|    = {maximos['fatorada']:.3e}")
+    print(f"max |dif|          = {maximos['erro_expandida']:.3e}  (expandida)")
+    print(f"max |dif|          = {maximos['erro_compensada']:.3e}  (compensada)")
+
+
+def executar():
+    x = np.linspace(a, b, n)
+    f_expand = horner(COEFICIENTES_QUESTAO2, x)
+    f_compensada = horner_compensado(COEFICIENTES_QUESTAO2, x)
+    f_estavel = fatorada(x)
+
+    print(f"===== {n} pontos em [1 - 2e-8, 1 + 2e-8] =====")
+    imprimir_maximos(cache.chamar(estudo_cancelamento, a, b, n))
+    print(f"\n===== {N_GRANDE} pontos =====")
+    imprimir_maximos(cache.chamar(estudo_cancelamento, a, b, N_GRANDE))
+
+    # Gráficos (tiny = realmin, para o log de zero)
+    tiny = np.finfo(np.float64).tiny
+    figuras = [
+        graficos.figura("questao2.png", "f(x) - Forma Expandida vs (x-1)^7", [
+            ("f(x)", {"Expandida": (x, f_expand), "Compensada": (x, f_compensada), "(x-1)^7": (x, f_estavel)}),
+        ], xlabel="x", ylabel="f(x)"),
+        graficos.figura("questao2_log.png", "Escala log", [
+            ("|f(x)|", {"|Expandida|": (x, np.abs(f_expand) + tiny), "|Compensada|": (x, np.abs(f_compensada) + tiny),
+                        "|(x-1)^7|": (x, np.abs(f_estavel) + tiny)}),
+            ("Erro entre as formas", {"Expandida": (x, np.abs(f_expand - f_estavel) + tiny),
+                                      "Compensada": (x, np.abs(f_compensada - f_estavel) + tiny)}),
+        ], xlabel="x", ylabel="|f(x)|", log=True),
+    ]
+    return figuras
+
+
+if __name__ == "__main__":
+    # com --salvar, os gráficos são gravados em resultados/graficos sem abrir janelas
+    figuras = executar()
+    if "--salvar" in sys.argv:
+        graficos.salvar(figuras)
+    else:
+        graficos.mostrar(figuras)
@@ -1,133 +1,157 @@
+import collections
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from raizes import bisseccao, newton, secante, falsa_posicao, ponto_fixo, diagnostico, graficos, lote, armazenamento, cache
 
 T, L, g = 2, 1.0, 9.81
 
-def f(theta):
-    return np.sin(theta) - (T / (2 * np.pi)) * np.sqrt(g / L)
+def constante_pendulo(T, L, g):
+    return (T / (2 * np.pi)) * np.sqrt(g / L)
 
-def df(theta):
+def f(theta, c=constante_pendulo(T, L, g)):
+    return np.sin(theta) - c
+
+def df(theta, c=None):
     return np.cos(theta)
 
-def bisseccao(inicio, fim, tol=1e-6, max_iter=100):
-    lista = []
-    for i in range(max_iter):
-        meio = (inicio + fim) / 2
-        lista.append(meio)
-        if abs(f(meio)) < tol:
-            break
-        if f(inicio) * f(meio) < 0:
-            fim = meio
-        else:
-            inicio = meio
-    return meio, lista
-
-def newton(chute, tol=1e-6, max_iter=100):
-    lista = []
-    for i in range(max_iter):
-        proximo = chute - f(chute) / df(chute)
-        lista.append(proximo)
-        if abs(f(proximo)) < tol:
-            break
-        chute = proximo
-    return proximo, lista
-
-def secante(chute1, chute2, tol=1e-6, max_iter=100):
-    lista = []
-    for i in range(max_iter):
-        proximo = chute2 - f(chute2) * (chute2 - chute1) / (f(chute2) - f(chute1))
-        lista.append(proximo)
-        if abs(f(proximo)) < tol:
-            break
-        chute1, chute2 = chute2, proximo
-    return proximo, lista
-
-def falsa_posicao(inicio, fim, tol=1e-6, max_iter=100):
-    lista = []
-    for i in range(max_iter):
-        falso = (inicio * f(fim) - fim * f(inicio)) / (f(fim) - f(inicio))
-        lista.append(falso)
-        if abs(f(falso)) < tol:
-            break
-        if f(inicio) * f(falso) < 0:
-            fim = falso
-        else:
-            inicio = falso
-    return falso, lista
-
-def ponto_fixo(chute, tol=1e-6, max_iter=100):
-    lista = []
-    constante = (T / (2 * np.pi)) * np.sqrt(g / L)
-    if abs(constante) <= 1:               #arco seno
-        for i in range(max_iter):
-            proximo = np.arcsin(constante)
-            lista.append(proximo)
-            if abs(proximo - chute) < tol:
-                break
-            chute = proximo
-    else:
-        for i in range(max_iter):         #seno
-            proximo = chute - (np.sin(chute) - constante)
-            lista.append(proximo)
-            if abs(proximo - chute) < tol:
-                break
-            chute = proximo
-    return proximo, lista
-
-# Execução
-raiz_bis, lista_bis = bisseccao(0, 2)
-raiz_new, lista_new = newton(1)
-raiz_sec, lista_sec = secante(0.5, 1.5)
-raiz_fp,  lista_fp  = falsa_posicao(0, 2)
-raiz_pf,  lista_pf  = ponto_fixo(1)
-
-def diagnostico(nome, raiz, lista, tol=1e-6):
-    convergiu = abs(f(raiz)) < tol and not (raiz != raiz or raiz == float('inf') or raiz == float('-inf'))
-    status = "CONVERGENTE ✓" if convergiu else "DIVERGENTE ✗"
-
-    # diferença entre as 2 últimas iterações
-    if len(lista) >= 2:
-        erro_arred_abs = abs(lista[-1] - lista[-2])
+# Forma de ponto fixo: θ = θ - (sen θ - c). Sem caso especial para |c| <= 1:
+# com |c| > 1 não há solução e o ponto fixo para sozinho com DIVERGIU em
+# poucas iterações. Perto da raiz, |g'| = |1 - cos θ| ≈ 0.92 (convergência
+# linear lenta), por isso a iteração é acelerada por Steffensen.
+def g_pendulo(theta, c=constante_pendulo(T, L, g)):
+    return theta - (np.sin(theta) - c)
+
+# Varredura de parâmetros
+# Resolve sin θ = c para todas as combinações de (T, L, g) com os métodos em
+# lote: Newton a partir de θ = 1 e bissecção em [-π/2, π/2] para o que não
+# convergir. Combinações com |c| > 1 não têm solução e ficam com θ = nan e
+# status lote.FALHOU sem gastar iterações. O trabalho é feito em blocos de
+# tamanho_bloco pontos (memória limitada) e, com processos > 1, os blocos são
+# distribuídos entre processos (processos=None usa todos os núcleos), com no
+# máximo 2 blocos por processo em andamento: cada bloco pronto é guardado e
+# descartado antes de o próximo ser enviado, então a memória não cresce com
+# o tamanho da malha.
+# Com pasta, cada bloco é gravado em disco assim que fica pronto (colunas
+# theta, iteracoes e status em .npy, ver raizes/armazenamento.py) e o retorno
+# são os arquivos mapeados em memória, sem alocar a malha inteira.
+def _resolver_bloco(Ts, Ls, gs, inicio, fim, tol, max_iter):
+    iT, iL, ig = np.unravel_index(np.arange(inicio, fim), (len(Ts), len(Ls), len(gs)))
+    c = constante_pendulo(Ts[iT], Ls[iL], gs[ig])
+
+    theta = np.full(c.shape, np.nan)
+    iteracoes = np.zeros(c.shape, dtype=np.int64)
+    status = np.full(c.shape, lote.FALHOU, dtype=np.int8)
+
+    com_solucao = np.abs(c) <= 1
+    c = c[com_solucao]
+    raiz, it, st = lote.newton(f, df, np.ones_like(c), tol, max_iter, args=(c,))
+
+    refazer = st != lote.CONVERGIU
+    if refazer.any():
+        cr = c[refazer]
+        raiz_b, it_b, st_b = lote.bisseccao(f, np.full_like(cr, -np.pi / 2), np.full_like(cr, np.pi / 2),
+                                             tol, max_iter, args=(cr,))
+        raiz[refazer], st[refazer] = raiz_b, st_b
+        it[refazer] += it_b
+
+    theta[com_solucao], iteracoes[com_solucao], status[com_solucao] = raiz, it, st
+    return inicio, theta, iteracoes, status
+
+def varredura(Ts, Ls, gs, tol=1e-6, max_iter=100, tamanho_bloco=1_000_000, processos=1, pasta=None):
+    Ts = np.atleast_1d(np.asarray(Ts, dtype=np.float64))
+    Ls = np.atleast_1d(np.asarray(Ls, dtype=np.float64))
+    gs = np.atleast_1d(np.asarray(gs, dtype=np.float64))
+    formato = (len(Ts), len(Ls), len(gs))
+    total = len(Ts) * len(Ls) * len(gs)
+
+    blocos = [(i, min(i + tamanho_bloco, total)) for i in range(0, total, tamanho_bloco)]
+
+    if pasta is None:
+        theta = np.empty(total)
+        iteracoes = np.empty(total, dtype=np.int64)
+        status = np.empty(total, dtype=np.int8)
+
+        def guardar(resultado):
+            inicio, th, it, st = resultado
+            fim = inicio + len(th)
+            theta[inicio:fim], iteracoes[inicio:fim], status[inicio:fim] = th, it, st
     else:
-        erro_arred_abs = float('nan') #nan - valor não válido por conta da quantidade de iterações
-
-    # erro absoluto dividido pelo valor atual
-    if abs(raiz) > 0:
-        erro_arred_rel = erro_arred_abs / abs(raiz)
+        # os blocos chegam em ordem (também com processos), então basta anexar
+        gravador = armazenamento.Gravador(pasta, metadados={
+            "formato": formato, "T": Ts.tolist(), "L": Ls.tolist(), "g": gs.tolist(),
+            "tol": tol, "max_iter": max_iter})
+
+        def guardar(resultado):
+            _, th, it, st = resultado
+            gravador.anexar(theta=th, iteracoes=it, status=st)
+
+    try:
+        if processos == 1 or len(blocos) <= 1:
+            for inicio, fim in blocos:
+                guardar(_resolver_bloco(Ts, Ls, gs, inicio, fim, tol, max_iter))
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                limite = 2 * (processos or os.cpu_count() or 1)
+                em_andamento = collections.deque()
+                for inicio, fim in blocos:
+                    if len(em_andamento) >= limite:
+                        guardar(em_andamento.popleft().result())
+                    em_andamento.append(executor.submit(_resolver_bloco, Ts, Ls, gs, inicio, fim, tol, max_iter))
+                while em_andamento:
+                    guardar(em_andamento.popleft().result())
+    finally:
+        # também se a varredura falhar: os arquivos ficam com os blocos já gravados
+        if pasta is not None:
+            gravador.fechar()
+
+    if pasta is not None:
+        dados = armazenamento.Resultados(pasta)
+        theta, iteracoes, status = dados["theta"], dados["iteracoes"], dados["status"]
+    return theta.reshape(formato), iteracoes.reshape(formato), status.reshape(formato)
+
+# Com pasta, os resultados dos métodos também vão para disco (um problema
+# por método): raiz, iteracoes e status como colunas e os iterados como
+# coluna irregular, lidos de volta com Resultados(pasta).historico(i).
+def gravar(metodos, pasta):
+    resultados = list(metodos.values())
+    with armazenamento.Gravador(pasta, irregulares=("historico",),
+                                metadados={"metodos": list(metodos), "T": T, "L": L, "g": g}) as gravador:
+        gravador.anexar(raiz=np.array([float(r.raiz) for r in resultados]),
+                        iteracoes=np.array([r.iteracoes for r in resultados], dtype=np.int64),
+                        status=np.array([r.status for r in resultados], dtype=np.int8),
+                        historico=[np.asarray(r.historico, dtype=np.float64) for r in resultados])
+
+def executar(pasta=None):
+    # Execução
+    metodos = {
+        "Bissecção":               cache.chamar(bisseccao, f, 0, 2),
+        "Newton":                  cache.chamar(newton, f, df, 1),
+        "Secante":                 cache.chamar(secante, f, 0.5, 1.5),
+        "Falsa Posição":           cache.chamar(falsa_posicao, f, 0, 2),
+        "Ponto Fixo (Steffensen)": cache.chamar(ponto_fixo, g_pendulo, 1, aceleracao="steffensen"),
+    }
+
+    # Diagnóstico e coleta de status para os gráficos
+    status = {nome: diagnostico(nome, f, resultado) for nome, resultado in metodos.items()}
+    if pasta is not None:
+        gravar(metodos, pasta)
+
+    # Gráficos
+    paineis = [(f"{nome} — {status[nome]}", {None: resultado.historico}) for nome, resultado in metodos.items()]
+    figuras = [graficos.figura("questao5.png", f"Pêndulo: T = {T}, L = {L}, g = {g}", paineis,
+                               ylabel="Aproximação de θ (radianos)")]
+    return figuras
+
+
+if __name__ == "__main__":
+    # com --salvar, os gráficos são gravados em resultados/graficos sem abrir janelas
+    # e os resultados dos métodos, em resultados/questao5
+    figuras = executar("resultados/questao5" if "--salvar" in sys.argv else None)
+    if "--salvar" in sys.argv:
+        graficos.salvar(figuras)
     else:
-        erro_arred_rel = float('nan')
-
-    erro_trunc = abs(f(raiz))
-
-    print(f"\n{'='*40}")
-    print(f"  {nome}: {status}")
-    print(f"  Iterações                    : {len(lista)}")
-    print(f"  Erro Arredondamento Absoluto : {erro_arred_abs:.2e}")
-    print(f"  Erro Arredondamento Relativo : {erro_arred_rel:.2e}")
-    print(f"  Erro de Truncamento          : {erro_trunc:.2e}")
-    print(f"  Raiz encontrada              : {raiz:.8f}")
-
-    return status
-
-# Diagnóstico e coleta de status para os gráficos
-status_bis = diagnostico("Bissecção",     raiz_bis, lista_bis)
-status_new = diagnostico("Newton",        raiz_new, lista_new)
-status_sec = diagnostico("Secante",       raiz_sec, lista_sec)
-status_fp  = diagnostico("Falsa Posição", raiz_fp,  lista_fp)
-status_pf  = diagnostico("Ponto Fixo",    raiz_pf,  lista_pf)
-
-# Gráficos
-metodos = {
-    "Bissecção":     (lista_bis, status_bis),
-    "Newton":        (lista_new, status_new),
-    "Secante":       (lista_sec, status_sec),
-    "Falsa Posição": (lista_fp,  status_fp),
-    "Ponto Fixo":    (lista_pf,  status_pf),
-}
-
-for nome, (lista, status) in metodos.items():
-    plt.plot(lista)
-    plt.title(f"{nome} — {status}")
-    plt.xlabel("Iteração")
-    plt.ylabel("Aproximação de θ (radianos)")
-    plt.show()
\ No newline at end of file
+        graficos.mostrar(figuras)
\ No newline at end of file
@@ -0,0 +1,33 @@
+from .resultado import Resultado, CONVERGIU, MAX_ITER, FALHOU, ESTAGNOU, DIVERGIU, CICLO, NOMES_STATUS
+from .historico import Historico
+from .metodos import (
+    bisseccao,
+    falsa_posicao,
+    illinois,
+    newton,
+    secante,
+    ponto_fixo,
+    brent,
+    newton_bisseccao,
+    halley,
+    householder,
+    iterar_bisseccao,
+    iterar_falsa_posicao,
+    iterar_illinois,
+    iterar_newton,
+    iterar_secante,
+    iterar_ponto_fixo,
+    iterar_brent,
+    iterar_newton_bisseccao,
+    iterar_halley,
+    iterar_householder,
+)
+from .precisao import Precisao, precisao
+from .tolerancia import Tolerancia, tolerancia
+from .divergencia import contracao
+from .portfolio import portfolio
+from .busca import encontrar_raizes
+from .polinomio import Polinomio, raizes_polinomios
+from .dual import Dual, valor_e_derivada, derivada, derivadas
+from .diagnostico import convergiu, ordem_convergencia, diagnostico, imprimir_ranking
+from . import lote, truncado, compensado, pontoflutuante, cache, armazenamento
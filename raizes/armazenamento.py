@@ -0,0 +1,157 @@
+import json
+import os
+
+import numpy as np
+
+# ==========================================================
+# ARMAZENAMENTO BINÁRIO DE RESULTADOS
+# ==========================================================
+# Uma pasta por conjunto de resultados, com um arquivo .npy por coluna
+# (raizes.npy, iteracoes.npy, status.npy...), gravados em fluxo: cada bloco
+# de problemas resolvido é anexado ao fim dos arquivos, sem juntar tudo em
+# memória antes. Colunas irregulares (um array de tamanho variável por
+# problema, como os históricos) viram dois arquivos: <nome>.npy com todos os
+# valores concatenados e <nome>_offsets.npy com n + 1 posições, de modo que
+# o i-ésimo histórico é valores[offsets[i]:offsets[i + 1]].
+# metadados.json guarda o que não é coluna (formato da malha, parâmetros).
+#
+# O cabeçalho de cada .npy reserva espaço fixo e é reescrito a cada bloco,
+# então os arquivos são sempre .npy válidos (com os blocos já gravados)
+# mesmo durante a execução ou se ela for interrompida.
+#
+# Leitura: Resultados(pasta) abre as colunas com np.load(mmap_mode="r"),
+# só quando pedidas; o sistema operacional traz do disco apenas as páginas
+# acessadas, então fatias e reduções funcionam em conjuntos maiores que a
+# memória.
+#
+#   with Gravador("resultados/varredura", irregulares=("historico",)) as gravador:
+#       for bloco in blocos:
+#           gravador.anexar(raizes=..., iteracoes=..., status=..., historico=[h1, h2, ...])
+#   dados = Resultados("resultados/varredura")
+#   dados["raizes"][:10], dados.historico(3)
+
+_MAGICO = b"\x93NUMPY\x01\x00"
+_TAMANHO_CABECALHO = 128
+
+
+def _cabecalho(dtype, n):
+    texto = f"{{'descr': {np.lib.format.dtype_to_descr(dtype)!r}, 'fortran_order': False, 'shape': ({n},), }}"
+    espaco = _TAMANHO_CABECALHO - len(_MAGICO) - 2
+    if len(texto) + 1 > espaco:
+        raise ValueError(f"dtype {dtype} não cabe no cabeçalho reservado")
+    texto = texto.ljust(espaco - 1) + "\n"
+    return _MAGICO + espaco.to_bytes(2, "little") + texto.encode("latin1")
+
+
+class _ColunaNpy:
+    # arquivo .npy 1-D que cresce a cada anexar
+    __slots__ = ("arquivo", "dtype", "n")
+
+    def __init__(self, caminho, dtype):
+        self.dtype = np.dtype(dtype)
+        self.n = 0
+        self.arquivo = open(caminho, "wb")
+        self.arquivo.write(_cabecalho(self.dtype, 0))
+
+    def anexar(self, valores):
+        valores = np.ascontiguousarray(valores, dtype=self.dtype).ravel()
+        self.arquivo.write(valores.tobytes())
+        self.n += valores.size
+        # atualiza o tamanho no cabeçalho e volta para o fim
+        self.arquivo.seek(0)
+        self.arquivo.write(_cabecalho(self.dtype, self.n))
+        self.arquivo.seek(0, os.SEEK_END)
+
+    def fechar(self):
+        self.arquivo.close()
+
+
+class Gravador:
+    def __init__(self, pasta, irregulares=(), metadados=None):
+        self.pasta = pasta
+        self.irregulares = set(irregulares)
+        self.colunas = {}
+        self.offsets = {}
+        self.n = 0
+        os.makedirs(pasta, exist_ok=True)
+        self._salvar_metadados(metadados or {})
+
+    def _salvar_metadados(self, metadados):
+        self.metadados = dict(metadados)
+        with open(os.path.join(self.pasta, "metadados.json"), "w", encoding="utf-8") as arquivo:
+            json.dump(self.metadados, arquivo, ensure_ascii=False, indent=2)
+
+    def _coluna(self, nome, dtype):
+        if nome not in self.colunas:
+            if self.n:
+                raise ValueError(f"coluna {nome!r} apareceu depois do primeiro bloco")
+            self.colunas[nome] = _ColunaNpy(os.path.join(self.pasta, nome + ".npy"), dtype)
+            if nome in self.irregulares:
+                self.offsets[nome] = _ColunaNpy(os.path.join(self.pasta, nome + "_offsets.npy"), np.int64)
+                self.offsets[nome].anexar([0])
+        return self.colunas[nome]
+
+    def anexar(self, **colunas):
+        # cada coluna é um bloco com o mesmo número de problemas; as irregulares
+        # são listas de arrays, um por problema
+        tamanhos = {len(v) if nome in self.irregulares else np.size(v) for nome, v in colunas.items()}
+        if len(tamanhos) > 1:
+            raise ValueError(f"colunas com tamanhos diferentes no mesmo bloco: {sorted(tamanhos)}")
+        for nome, valores in colunas.items():
+            if nome in self.irregulares:
+                partes = [np.ravel(v) for v in valores]
+                dtype = partes[0].dtype if partes else np.float64
+                coluna = self._coluna(nome, dtype)
+                fim = coluna.n + np.cumsum([p.size for p in partes], dtype=np.int64)
+                if partes:
+                    coluna.anexar(np.concatenate(partes))
+                self.offsets[nome].anexar(fim)
+            else:
+                valores = np.asarray(valores)
+                self._coluna(nome, valores.dtype).anexar(valores)
+        if tamanhos:
+            self.n += tamanhos.pop()
+
+    def atualizar_metadados(self, **metadados):
+        self._salvar_metadados({**self.metadados, **metadados})
+
+    def fechar(self):
+        for coluna in [*self.colunas.values(), *self.offsets.values()]:
+            coluna.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+class Resultados:
+    def __init__(self, pasta):
+        self.pasta = pasta
+        with open(os.path.join(pasta, "metadados.json"), encoding="utf-8") as arquivo:
+            self.metadados = json.load(arquivo)
+        self._abertos = {}
+
+    def _abrir(self, nome):
+        if nome not in self._abertos:
+            self._abertos[nome] = np.load(os.path.join(self.pasta, nome + ".npy"), mmap_mode="r")
+        return self._abertos[nome]
+
+    @property
+    def colunas(self):
+        return sorted(nome[:-4] for nome in os.listdir(self.pasta)
+                      if nome.endswith(".npy") and not nome.endswith("_offsets.npy"))
+
+    def __getitem__(self, nome):
+        return self._abrir(nome)
+
+    def __len__(self):
+        for nome in self.colunas:
+            offsets = os.path.join(self.pasta, nome + "_offsets.npy")
+            return len(self._abrir(nome + "_offsets")) - 1 if os.path.exists(offsets) else len(self._abrir(nome))
+        return 0
+
+    def historico(self, i, nome="historico"):
+        offsets = self._abrir(nome + "_offsets")
+        return self._abrir(nome)[offsets[i]:offsets[i + 1]]
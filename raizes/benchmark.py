@@ -0,0 +1,96 @@
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# ==========================================================
+# MEDIÇÃO DE TEMPO
+# ==========================================================
+# Cada caso é executado algumas vezes para aquecimento, depois o número de
+# chamadas por amostra (lacos) é calibrado até a amostra durar pelo menos
+# tempo_minimo segundos, e então são tiradas `repeticoes` amostras. O tempo
+# por chamada é resumido pela mediana e pelo intervalo interquartil (IQR),
+# com o coletor de lixo desligado como no timeit.
+
+def _cronometrar(funcao, lacos):
+    t_inicio = time.perf_counter()
+    for _ in range(lacos):
+        funcao()
+    return time.perf_counter() - t_inicio
+
+
+def calibrar(funcao, tempo_minimo=0.01):
+    lacos = 1
+    while True:
+        tempo = _cronometrar(funcao, lacos)
+        if tempo >= tempo_minimo:
+            return lacos
+        if tempo > 0:
+            lacos = max(lacos * 2, int(lacos * 1.2 * tempo_minimo / tempo))
+        else:
+            lacos *= 10
+
+
+def medir(funcao, avaliacoes=0, repeticoes=15, aquecimento=3, tempo_minimo=0.01):
+    for _ in range(aquecimento):
+        funcao()
+
+    gc_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        lacos = calibrar(funcao, tempo_minimo)
+        tempos = np.array([_cronometrar(funcao, lacos) / lacos for _ in range(repeticoes)])
+    finally:
+        if gc_ativo:
+            gc.enable()
+
+    q1, mediana, q3 = np.percentile(tempos, [25, 50, 75])
+    return {
+        "mediana_s": float(mediana),
+        "iqr_s": float(q3 - q1),
+        "lacos": lacos,
+        "repeticoes": repeticoes,
+        "avaliacoes": avaliacoes,
+        "avaliacoes_por_s": avaliacoes / mediana if mediana > 0 else float("nan"),
+    }
+
+
+# ==========================================================
+# ARQUIVO DE RESULTADOS
+# ==========================================================
+# Os resultados são salvos em JSON junto com a descrição do ambiente
+# (versões, máquina e commit), para comparar rankings entre máquinas e
+# entre commits.
+
+def ambiente():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "data": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "commit": commit,
+    }
+
+
+def salvar(casos, caminho):
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump({"ambiente": ambiente(), "casos": casos}, arquivo, ensure_ascii=False, indent=2)
+
+
+def carregar(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
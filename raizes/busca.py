@@ -0,0 +1,70 @@
+import numpy as np
+
+from . import lote
+from .resultado import CONVERGIU
+
+# ==========================================================
+# BUSCA DE TODAS AS RAÍZES NUM INTERVALO
+# ==========================================================
+# f é avaliada de uma vez numa malha de `pontos` subintervalos de [a, b]:
+#   - pontos da malha com f = 0 já são raízes;
+#   - cada troca de sinal entre vizinhos vira um intervalo, e todos os
+#     intervalos são refinados juntos por um método em lote (lote.py). A
+#     troca de sinal já garante a raiz: vale também o que não chega a
+#     |f| < tol (f em escala grande, intervalo de uma ULP, max_iter), desde
+#     que |f| tenha diminuído em relação aos extremos; se cresceu, a troca
+#     era um polo (tan, 1/x);
+#   - mínimos locais de |f| sem troca de sinal ao lado (raízes de
+#     multiplicidade par, como em (x - 1)²) são refinados por seção áurea
+#     sobre |f| e só contam se |f| < tol no mínimo.
+# Mais pontos encontram raízes mais próximas entre si (duas raízes no mesmo
+# subintervalo se cancelam), ao custo de mais avaliações de f. f precisa
+# aceitar arrays do NumPy, como nos métodos em lote.
+# Devolve um array ordenado com as raízes.
+
+RAZAO_AUREA = (np.sqrt(5) - 1) / 2
+
+
+def _minimo_abs(f, a, b, max_iter):
+    # seção áurea vetorizada: cada [a, b] encolhe pela razão áurea por passo
+    c, d = b - RAZAO_AUREA * (b - a), a + RAZAO_AUREA * (b - a)
+    fc, fd = np.abs(f(c)), np.abs(f(d))
+    for i in range(max_iter):
+        esquerda = fc < fd
+        a, b = np.where(esquerda, a, c), np.where(esquerda, d, b)
+        novo = np.where(esquerda, b - RAZAO_AUREA * (b - a), a + RAZAO_AUREA * (b - a))
+        f_novo = np.abs(f(novo))
+        c, fc, d, fd = (np.where(esquerda, novo, d), np.where(esquerda, f_novo, fd),
+                        np.where(esquerda, c, novo), np.where(esquerda, fc, f_novo))
+        if np.all(b - a <= np.finfo(np.float64).eps * np.maximum(np.abs(a), 1)):
+            break
+    return np.where(fc < fd, c, d)
+
+
+def encontrar_raizes(f, a, b, pontos=1000, tol=1e-10, max_iter=100, metodo=lote.illinois):
+    x = np.linspace(a, b, pontos + 1)
+    with np.errstate(all="ignore"):
+        y = f(x)
+    y_abs = np.abs(y)
+
+    zeros = x[y == 0]
+
+    troca = y[:-1] * y[1:] < 0
+    intervalos = np.flatnonzero(troca)
+    raizes, _, status = metodo(f, x[intervalos], x[intervalos + 1], tol=tol, max_iter=max_iter)
+    with np.errstate(all="ignore"):
+        residuo = np.abs(f(raizes))
+    diminuiu = residuo <= np.minimum(y_abs[intervalos], y_abs[intervalos + 1])
+    refinadas = raizes[(status == CONVERGIU) | (np.isfinite(raizes) & diminuiu)]
+
+    # mínimos locais de |f| no interior, longe de trocas de sinal e de zeros exatos;
+    # a comparação é estrita à esquerda, então de dois vizinhos com o mesmo |f|
+    # (raiz no meio deles) só o primeiro vira candidato
+    i = np.arange(1, pontos)
+    minimos = i[(y_abs[i] < y_abs[i - 1]) & (y_abs[i] <= y_abs[i + 1]) & (y_abs[i] > 0)
+                & ~troca[i - 1] & ~troca[i]]
+    with np.errstate(all="ignore"):
+        candidatos = _minimo_abs(f, x[minimos - 1], x[minimos + 1], max_iter)
+        tangentes = candidatos[np.abs(f(candidatos)) < tol]
+
+    return np.sort(np.concatenate([zeros, refinadas, tangentes]))
@@ -0,0 +1,304 @@
+import hashlib
+import os
+import pickle
+import platform
+import sys
+import tempfile
+import types
+import zlib
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+
+from .precisao import Precisao
+
+# ==========================================================
+# CACHE DE RESULTADOS EM DISCO
+# ==========================================================
+# Guarda o valor de cada chamada (um Resultado com o histórico, o vencedor
+# de um portfólio...) num arquivo em `pasta`, com o nome igual ao hash
+# SHA-256 de tudo que determina o resultado:
+#   - a função chamada e as funções passadas como argumento, pelo bytecode
+#     (não pelo nome): constantes, nomes usados, valores padrão, variáveis
+#     de closure e, recursivamente, as funções e valores globais que elas
+#     usam, então editar f, g ou o próprio método invalida a entrada;
+#   - classes pelo bytecode dos seus métodos (Historico, Dual, Polinomio...),
+#     pelo mesmo critério das funções;
+#   - funções e classes da biblioteca padrão (ThreadPoolExecutor, math...)
+#     só pelo nome, e a versão do Python entra na chave: o estado interno
+#     delas (locks, weakrefs) muda a cada processo;
+#   - os demais argumentos pelo valor (arrays pelo conteúdo, Precisao pelo
+#     nome);
+#   - o código-fonte de raizes/*.py: módulos entram na descrição só pelo
+#     nome, então qualquer edição no pacote invalida o cache inteiro.
+# Objetos sem descrição estável (repr com endereço de memória) só fazem a
+# chave nunca se repetir: a chamada é refeita, nunca reaproveitada errado.
+#
+# Os valores são gravados com pickle comprimido (zlib). Cada leitura atualiza
+# a data de modificação do arquivo, e quando a pasta passa de `limite` bytes
+# os arquivos usados há mais tempo são apagados (LRU). A gravação passa por
+# um arquivo temporário e os.replace, então processos em paralelo podem
+# usar a mesma pasta.
+#
+# Uso:
+#   cache.ativar("resultados/cache")
+#   r = cache.chamar(bisseccao, f, 0, 1, tipo="float32")
+# Sem cache ativo, cache.chamar só chama a função. O cache guarda só
+# resultados: medições de tempo (benchmark.medir) nunca passam por ele e são
+# sempre feitas de novo, para que um tempo de outra máquina, commit ou carga
+# nunca seja apresentado como medido agora.
+# Valores que o pickle não consegue gravar são devolvidos normalmente, só não
+# ficam no cache (guardar devolve False).
+
+_VERSAO = 3
+_AUSENTE = object()
+_EXTENSAO = ".pkl.z"
+
+_SIMPLES = (type(None), bool, int, float, complex, str, bytes, Fraction, Decimal)
+
+_fontes = None
+
+
+def _hash_fontes():
+    # calculado uma vez por processo
+    global _fontes
+    if _fontes is None:
+        h = hashlib.sha256()
+        pasta = os.path.dirname(os.path.abspath(__file__))
+        for nome in sorted(os.listdir(pasta)):
+            if nome.endswith(".py"):
+                with open(os.path.join(pasta, nome), "rb") as arquivo:
+                    h.update(f"{nome}:".encode())
+                    h.update(arquivo.read())
+        _fontes = h.hexdigest()
+    return _fontes
+
+
+def _biblioteca_padrao(obj):
+    modulo = getattr(obj, "__module__", None) or ""
+    return modulo.partition(".")[0] in sys.stdlib_module_names
+
+
+def _descrever_codigo(codigo, h):
+    h.update(codigo.co_code)
+    h.update(repr(codigo.co_names).encode())
+    for constante in codigo.co_consts:
+        if isinstance(constante, types.CodeType):
+            _descrever_codigo(constante, h)
+        else:
+            h.update(repr(constante).encode())
+
+
+def _nomes_globais(codigo):
+    nomes = set(codigo.co_names)
+    for constante in codigo.co_consts:
+        if isinstance(constante, types.CodeType):
+            nomes |= _nomes_globais(constante)
+    return nomes
+
+
+def _descrever(obj, h, vistos):
+    if isinstance(obj, _SIMPLES) or isinstance(obj, np.generic):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (tuple, list)):
+        h.update(f"{type(obj).__name__}:{len(obj)};".encode())
+        for item in obj:
+            _descrever(item, h, vistos)
+    elif isinstance(obj, dict):
+        h.update(f"dict:{len(obj)};".encode())
+        for chave in sorted(obj, key=repr):
+            _descrever(chave, h, vistos)
+            _descrever(obj[chave], h, vistos)
+    elif isinstance(obj, Precisao):
+        h.update(f"Precisao:{obj.nome};".encode())
+    elif isinstance(obj, types.ModuleType):
+        h.update(f"module:{obj.__name__};".encode())
+    elif isinstance(obj, (type, types.FunctionType)) and _biblioteca_padrao(obj):
+        h.update(f"padrao:{obj.__module__}.{obj.__qualname__};".encode())
+    elif isinstance(obj, type):
+        _descrever_classe(obj, h, vistos)
+    elif isinstance(obj, types.FunctionType):
+        _descrever_funcao(obj, h, vistos)
+    elif isinstance(obj, types.MethodType):
+        _descrever(obj.__self__, h, vistos)
+        _descrever(obj.__func__, h, vistos)
+    elif hasattr(obj, "func") and hasattr(obj, "keywords"):
+        # functools.partial
+        _descrever((obj.func, obj.args, obj.keywords), h, vistos)
+    elif isinstance(obj, (types.BuiltinFunctionType, np.ufunc)):
+        h.update(f"builtin:{getattr(obj, '__module__', '')}.{obj.__name__};".encode())
+    elif id(obj) in vistos:
+        h.update(b"ciclo;")
+    else:
+        # objeto qualquer: a classe e os atributos (de __dict__ ou __slots__)
+        vistos.add(id(obj))
+        h.update(f"{type(obj).__module__}.{type(obj).__qualname__};".encode())
+        slots = [s for classe in type(obj).__mro__ for s in getattr(classe, "__slots__", ())]
+        atributos = dict(getattr(obj, "__dict__", {}))
+        atributos.update((s, getattr(obj, s)) for s in slots if hasattr(obj, s))
+        if atributos:
+            _descrever(atributos, h, vistos)
+        else:
+            h.update(repr(obj).encode())
+
+
+def _descrever_funcao(funcao, h, vistos):
+    h.update(f"funcao:{funcao.__module__}.{funcao.__qualname__};".encode())
+    if id(funcao) in vistos:
+        # recursão (direta ou mútua): o nome basta
+        return
+    vistos.add(id(funcao))
+    codigo = funcao.__code__
+    _descrever_codigo(codigo, h)
+    _descrever((funcao.__defaults__, funcao.__kwdefaults__), h, vistos)
+    for celula in funcao.__closure__ or ():
+        try:
+            _descrever(celula.cell_contents, h, vistos)
+        except ValueError:
+            # célula ainda vazia
+            h.update(b"vazia;")
+    globais = funcao.__globals__
+    for nome in sorted(_nomes_globais(codigo)):
+        if nome in globais:
+            h.update(f"global:{nome};".encode())
+            _descrever(globais[nome], h, vistos)
+
+
+def _descrever_classe(classe, h, vistos):
+    h.update(f"classe:{classe.__module__}.{classe.__qualname__};".encode())
+    if id(classe) in vistos:
+        return
+    vistos.add(id(classe))
+    # só o que é Python: métodos de tipos em C (float, ndarray) não mudam
+    for base in classe.__mro__:
+        for nome, membro in sorted(vars(base).items()):
+            if isinstance(membro, (staticmethod, classmethod)):
+                membro = membro.__func__
+            elif isinstance(membro, property):
+                membro = membro.fget
+            if isinstance(membro, types.FunctionType):
+                h.update(f"metodo:{nome};".encode())
+                _descrever_funcao(membro, h, vistos)
+
+
+def chave(funcao, args=(), kwargs=None):
+    h = hashlib.sha256(f"raizes.cache:{_VERSAO}:{platform.python_version()}:{_hash_fontes()};".encode())
+    _descrever((funcao, tuple(args), dict(kwargs or {})), h, set())
+    return h.hexdigest()
+
+
+class Cache:
+    def __init__(self, pasta="resultados/cache", limite=256 * 2**20):
+        self.pasta = pasta
+        self.limite = limite
+        os.makedirs(pasta, exist_ok=True)
+
+    def _caminho(self, chave):
+        return os.path.join(self.pasta, chave + _EXTENSAO)
+
+    def obter(self, chave, padrao=None):
+        caminho = self._caminho(chave)
+        try:
+            with open(caminho, "rb") as arquivo:
+                valor = pickle.loads(zlib.decompress(arquivo.read()))
+        except (OSError, EOFError, zlib.error, pickle.UnpicklingError):
+            # ausente, apagado por outro processo ou corrompido
+            return padrao
+        try:
+            os.utime(caminho)
+        except OSError:
+            pass
+        return valor
+
+    def guardar(self, chave, valor):
+        try:
+            dados = zlib.compress(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # valor que o pickle não grava (uma lambda dentro do resultado):
+            # fica fora do cache
+            return False
+        descritor, temporario = tempfile.mkstemp(dir=self.pasta, suffix=".tmp")
+        try:
+            with os.fdopen(descritor, "wb") as arquivo:
+                arquivo.write(dados)
+            os.replace(temporario, self._caminho(chave))
+        except BaseException:
+            os.unlink(temporario)
+            raise
+        self._despejar()
+        return True
+
+    def _entradas(self):
+        entradas = []
+        with os.scandir(self.pasta) as iterador:
+            for entrada in iterador:
+                if entrada.name.endswith(_EXTENSAO):
+                    try:
+                        info = entrada.stat()
+                    except OSError:
+                        continue
+                    entradas.append((info.st_mtime, info.st_size, entrada.path))
+        return entradas
+
+    def _despejar(self):
+        entradas = self._entradas()
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        if total <= self.limite:
+            return
+        # menos usados primeiro
+        for _, tamanho, caminho in sorted(entradas):
+            try:
+                os.remove(caminho)
+            except OSError:
+                continue
+            total -= tamanho
+            if total <= self.limite:
+                break
+
+    def chamar(self, funcao, *args, **kwargs):
+        k = chave(funcao, args, kwargs)
+        valor = self.obter(k, _AUSENTE)
+        if valor is _AUSENTE:
+            valor = funcao(*args, **kwargs)
+            self.guardar(k, valor)
+        return valor
+
+    def tamanho(self):
+        return sum(tamanho for _, tamanho, _ in self._entradas())
+
+    def limpar(self):
+        for _, _, caminho in self._entradas():
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+
+
+# ==========================================================
+# CACHE ATIVO
+# ==========================================================
+# Os scripts chamam cache.chamar(...) sempre; o cache só é usado se alguém
+# (por exemplo, executar.py --cache) tiver chamado ativar antes.
+
+ativo = None
+
+
+def ativar(pasta="resultados/cache", limite=256 * 2**20):
+    global ativo
+    ativo = Cache(pasta, limite)
+    return ativo
+
+
+def desativar():
+    global ativo
+    ativo = None
+
+
+def chamar(funcao, *args, **kwargs):
+    if ativo is None:
+        return funcao(*args, **kwargs)
+    return ativo.chamar(funcao, *args, **kwargs)
@@ -0,0 +1,109 @@
+import numpy as np
+
+# ==========================================================
+# HORNER COMPENSADO
+# ==========================================================
+# Horner comum perde quase todos os dígitos perto de raízes múltiplas: em
+# x⁷ - 7x⁶ + ... - 1 perto de x = 1 as parcelas têm ordem 1 e o resultado,
+# ordem (x - 1)⁷, então o erro de arredondamento de cada soma domina.
+# O Horner compensado (Graillat, Langlois e Louvet) calcula o erro exato de
+# cada produto e de cada soma com transformações sem erro (TwoProduct com a
+# divisão de Veltkamp, TwoSum de Knuth), acumula esses erros num segundo
+# Horner e soma a correção no fim: o resultado é tão preciso quanto o Horner
+# em precisão dupla-dupla e arredondado para float64, usando só float64 e
+# operações vetorizadas do NumPy (sem longdouble nem Decimal).
+# Não há FMA no NumPy, por isso o TwoProduct usa a divisão de Veltkamp;
+# vale para |x| bem abaixo de 1e300 (sem overflow na divisão).
+
+_VELTKAMP = 2.0 ** 27 + 1
+
+
+def _soma_exata(a, b):
+    # a + b = s + e exatamente
+    s = a + b
+    z = s - a
+    return s, (a - (s - z)) + (b - z)
+
+
+def _dividir(a):
+    # a = alto + baixo, cada parte com no máximo 26 bits de mantissa
+    c = _VELTKAMP * a
+    alto = c - (c - a)
+    return alto, a - alto
+
+
+def _produto_exato(a, b):
+    # a * b = p + e exatamente
+    p = a * b
+    a_alto, a_baixo = _dividir(a)
+    b_alto, b_baixo = _dividir(b)
+    return p, a_baixo * b_baixo - (((p - a_alto * b_alto) - a_baixo * b_alto) - a_alto * b_baixo)
+
+
+def horner(coeficientes, x):
+    x = np.asarray(x, dtype=np.float64)
+    s = np.full_like(x, coeficientes[0])
+    for c in coeficientes[1:]:
+        s = s * x + c
+    return s
+
+
+def horner_compensado(coeficientes, x):
+    x = np.asarray(x, dtype=np.float64)
+    s = np.full_like(x, coeficientes[0])
+    correcao = np.zeros_like(x)
+    for c in coeficientes[1:]:
+        p, erro_produto = _produto_exato(s, x)
+        s, erro_soma = _soma_exata(p, c)
+        correcao = correcao * x + (erro_produto + erro_soma)
+    return s + correcao
+
+
+# ==========================================================
+# AVALIAÇÃO EM BLOCOS
+# ==========================================================
+# Dezenas de milhões de pontos são avaliados em blocos de tamanho_bloco
+# elementos: os temporários de cada bloco (cerca de dez arrays no Horner
+# compensado) ficam no cache e a memória extra não cresce com o total.
+# Só o array de saída tem o tamanho de x.
+
+def avaliar_em_blocos(funcao, x, tamanho_bloco=1 << 18, saida=None):
+    x = np.asarray(x, dtype=np.float64)
+    plano = x.ravel()
+    if saida is None:
+        saida = np.empty_like(plano)
+    for inicio in range(0, plano.size, tamanho_bloco):
+        fim = inicio + tamanho_bloco
+        saida[inicio:fim] = funcao(plano[inicio:fim])
+    return saida.reshape(x.shape)
+
+
+# ==========================================================
+# ESTUDO DO CANCELAMENTO (questao2.m)
+# ==========================================================
+# Compara, em n pontos igualmente espaçados de [a, b], a forma expandida de
+# (x - 1)⁷ por Horner comum e compensado com a forma fatorada (x - 1)⁷, que
+# é exata a menos de um arredondamento por operação. Os pontos são gerados
+# bloco a bloco (x = a + i (b - a) / (n - 1)), então nem a malha inteira
+# precisa caber na memória; devolve só os máximos.
+
+COEFICIENTES_QUESTAO2 = (1, -7, 21, -35, 35, -21, 7, -1)
+
+
+def fatorada(x):
+    return (x - 1) ** 7
+
+
+def estudo_cancelamento(a=1 - 2e-8, b=1 + 2e-8, n=401, coeficientes=COEFICIENTES_QUESTAO2,
+                        referencia=fatorada, tamanho_bloco=1 << 18):
+    passo = (b - a) / (n - 1)
+    maximos = dict.fromkeys(("expandida", "compensada", "fatorada", "erro_expandida", "erro_compensada"), 0.0)
+    for inicio in range(0, n, tamanho_bloco):
+        x = a + np.arange(inicio, min(inicio + tamanho_bloco, n)) * passo
+        exata = referencia(x)
+        comum = horner(coeficientes, x)
+        compensada = horner_compensado(coeficientes, x)
+        for chave, valores in (("expandida", comum), ("compensada", compensada), ("fatorada", exata),
+                               ("erro_expandida", comum - exata), ("erro_compensada", compensada - exata)):
+            maximos[chave] = max(maximos[chave], float(np.max(np.abs(valores))))
+    return maximos
@@ -0,0 +1,127 @@
+import math
+
+import numpy as np
+
+from .resultado import NOMES_STATUS
+
+# ==========================================================
+# CONVERGÊNCIA
+# ==========================================================
+
+def convergiu(f, resultado, tol=1e-6):
+    raiz = resultado.raiz
+    return math.isfinite(raiz) and abs(f(raiz)) < tol
+
+
+# ==========================================================
+# ORDEM DE CONVERGÊNCIA
+# ==========================================================
+# Estimada só com o histórico, sem conhecer a raiz, pelos passos
+# d_k = |x_{k+1} - x_k|: se d_{k+1} ≈ C d_k^q, então
+#   q ≈ log(d_{k+1} / d_k) / log(d_k / d_{k-1}),   C ≈ d_{k+1} / d_k^q.
+# Todas as estimativas são calculadas de uma vez; vale a última trinca de
+# passos decrescentes acima do nível de arredondamento (passos de poucos eps
+# não dizem nada sobre a taxa). Sem trinca válida, devolve (nan, nan).
+# Com q e C dá para prever quantas iterações uma nova tolerância custa.
+# O nível de arredondamento vem do dtype do histórico (float32 e float16 têm
+# eps bem maior que o float64); como as contas são em float64, ele nunca
+# fica abaixo do eps do float64 (longdouble, Fraction, Decimal).
+
+def _eps(historico):
+    dtype = np.asarray(historico).dtype
+    eps = np.finfo(np.float64).eps
+    if np.issubdtype(dtype, np.floating):
+        eps = max(eps, float(np.finfo(dtype).eps))
+    return eps
+
+
+def ordem_convergencia(historico, eps=None):
+    if eps is None:
+        eps = _eps(historico)
+    x = np.asarray(historico, dtype=np.float64)
+    if x.size < 4:
+        return float('nan'), float('nan')
+
+    d = np.abs(np.diff(x))
+    with np.errstate(all="ignore"):
+        log_d = np.log(d)
+        q = (log_d[2:] - log_d[1:-1]) / (log_d[1:-1] - log_d[:-2])
+        c = np.exp(log_d[2:] - q * log_d[1:-1])
+
+    acima_do_piso = d > 64 * eps * np.maximum(np.abs(x[1:]), 1)
+    validos = (acima_do_piso[:-2] & acima_do_piso[1:-1] & acima_do_piso[2:]
+               & (d[1:-1] < d[:-2]) & (d[2:] < d[1:-1]) & np.isfinite(q) & np.isfinite(c))
+    indices = np.flatnonzero(validos)
+    if indices.size == 0:
+        return float('nan'), float('nan')
+    return float(q[indices[-1]]), float(c[indices[-1]])
+
+
+# ==========================================================
+# DIAGNÓSTICO
+# ==========================================================
+
+def diagnostico(nome, f, resultado, tol=1e-6):
+    # float(): Fraction e Decimal não aceitam todos os formatos usados abaixo
+    raiz, historico = float(resultado.raiz), resultado.historico
+    status = "CONVERGENTE ✓" if convergiu(f, resultado, tol) else "DIVERGENTE ✗"
+
+    # diferença entre as 2 últimas iterações
+    if len(historico) >= 2:
+        erro_arred_abs = float(abs(historico[-1] - historico[-2]))
+    else:
+        erro_arred_abs = float('nan') #nan - valor não válido por conta da quantidade de iterações
+
+    # erro absoluto dividido pelo valor atual
+    if abs(raiz) > 0:
+        erro_arred_rel = erro_arred_abs / abs(raiz)
+    else:
+        erro_arred_rel = float('nan')
+
+    erro_trunc = float(abs(f(resultado.raiz)))
+    ordem, constante = ordem_convergencia(historico)
+
+    print("  " + "─"*38)
+    print(f"  {nome}: {status}")
+    print(f"  Iterações                    : {resultado.iteracoes}")
+    print(f"  Erro Arredondamento Absoluto : {erro_arred_abs:.2e}")
+    print(f"  Erro Arredondamento Relativo : {erro_arred_rel:.2e}")
+    print(f"  Erro de Truncamento          : {erro_trunc:.2e}")
+    print(f"  Ordem de convergência        : {ordem:.2f}")
+    print(f"  Constante assintótica        : {constante:.2e}")
+    print(f"  Avaliações de f / f'         : {resultado.avaliacoes[0]} / {resultado.avaliacoes[1]}")
+    print(f"  Parada                       : {NOMES_STATUS[resultado.status]}")
+    print(f"  Raiz encontrada              : {raiz:.8f}")
+
+    return status
+
+
+# ==========================================================
+# RANKING
+# ==========================================================
+# linhas: lista de (nome, resultado, convergiu, medicao), em que medicao é o
+# dicionário devolvido por benchmark.medir. Os convergentes são ordenados
+# pelo número de iterações; os divergentes são listados à parte. Ordem e C
+# são a ordem de convergência e a constante assintótica medidas no histórico.
+
+def imprimir_ranking(linhas):
+    convergentes = sorted((l for l in linhas if l[2]), key=lambda l: l[1].iteracoes)
+    divergentes = [l for l in linhas if not l[2]]
+
+    print("")
+    print("  " + "─"*101)
+    print("  #    Método                 Iterações   Avaliações  Ordem  C         Mediana (µs)  IQR (µs)  Aval/s")
+    print("  " + "─"*101)
+    for posicao, (nome, resultado, _, medicao) in enumerate(convergentes, start=1):
+        mediana_us = round(medicao["mediana_s"] * 1e6, 2) #arredonda e escolhe max de casas decimais
+        iqr_us = round(medicao["iqr_s"] * 1e6, 2)
+        ordem, constante = ordem_convergencia(resultado.historico)
+        print("  " + str(posicao).ljust(5) + nome.ljust(23) + str(resultado.iteracoes).ljust(12)
+              + str(sum(resultado.avaliacoes)).ljust(12) + f"{ordem:.2f}".ljust(7) + f"{constante:.2e}".ljust(10)
+              + str(mediana_us).ljust(14) + str(iqr_us).ljust(10)
+              + f"{medicao['avaliacoes_por_s']:.3g}")
+    if len(divergentes) > 0:
+        print("  " + "─"*101)
+        print("  Divergentes:")
+        for nome, *_ in divergentes:
+            print("  ✗  " + nome)
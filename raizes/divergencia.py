@@ -0,0 +1,93 @@
+import collections
+import math
+
+import numpy as np
+
+from .dual import valor_e_derivada
+from .resultado import DIVERGIU, CICLO
+
+# ==========================================================
+# DETECÇÃO PRECOCE DE DIVERGÊNCIA
+# ==========================================================
+# Newton, Secante, Ponto Fixo (também com Aitken/Steffensen), Halley e
+# Householder não têm intervalo que garanta a convergência; sem vigia, um
+# caso perdido gasta todas as max_iter iterações. O vigia observa cada
+# iterado e para:
+#   - com DIVERGIU, se |Δx| não diminui por `janela` iterações seguidas: a
+#     razão |Δx_k| / |Δx_{k-1}| estima |g'| (ou |N'| no Newton) e uma razão
+#     >= 1 sustentada significa que não há contração;
+#   - também com DIVERGIU, se o menor |Δx| visto não melhora há `paciencia`
+#     iterações (iterados caóticos, como Newton em x² + 1, sem raiz real).
+#     A secante desliga este teste (paciencia=inf): de chutes distantes ela
+#     vagueia por dezenas de iterações antes de convergir, e sem raiz real
+#     os passos crescem e o teste da janela já basta;
+#   - com CICLO, se o iterado repete um dos `memoria` anteriores (ciclos de
+#     Newton como 0 → 1 → 0 em x³ - 2x + 2, ou o vaivém de dois valores
+#     truncados no ponto fixo).
+# NaN e overflow continuam parando com FALHOU, pelo teste de finitude.
+#
+# Pré-voo do ponto fixo: contracao(g, x0) estima |g'(x0)| por números
+# duais (uma avaliação); se passar de 1, basta um passo crescente para
+# confirmar a divergência. Se a estimativa falhar (g que não aceita Dual,
+# como as do módulo math, ou g' que não existe em x0, como √x em 0), ela é
+# nan e vale só o vigia. valor_e_contracao devolve também g(x0), a parte
+# real da mesma avaliação (None se falhar), que o ponto fixo usa como
+# primeiro iterado em vez de avaliar g de novo.
+
+JANELA = 4
+
+
+def valor_e_contracao(g, x, *args):
+    try:
+        with np.errstate(all="ignore"):
+            valor, derivada = valor_e_derivada(g, x, *args)
+    except (TypeError, AttributeError, ArithmeticError, ValueError):
+        return None, np.full(np.shape(x), np.nan) if isinstance(x, np.ndarray) else math.nan
+    return valor, np.abs(derivada) if isinstance(x, np.ndarray) else abs(derivada)
+
+
+def contracao(g, x, *args):
+    return valor_e_contracao(g, x, *args)[1]
+
+
+def vigia(janela=JANELA, memoria=JANELA, paciencia=3 * JANELA, contracao=math.nan):
+    # devolve observar(x, passo): DIVERGIU, CICLO ou None
+    if contracao > 1:
+        janela = 1
+    recentes = collections.deque(maxlen=memoria)
+    anterior = menor = math.inf
+    crescendo = sem_melhora = 0
+
+    def observar(x, passo):
+        nonlocal anterior, menor, crescendo, sem_melhora
+        tamanho = abs(passo)
+        crescendo = crescendo + 1 if tamanho >= anterior else 0
+        anterior = tamanho
+        if tamanho < menor:
+            menor, sem_melhora = tamanho, 0
+        else:
+            sem_melhora += 1
+        if crescendo >= janela or sem_melhora >= paciencia:
+            return DIVERGIU
+        if x in recentes:
+            return CICLO
+        recentes.append(x)
+        return None
+    return observar
+
+
+# versão em lote: o mesmo vigia (sem o teste de ciclo) com um estado por
+# problema, (|Δx| anterior, menor |Δx|, passos crescentes, passos sem melhora)
+
+def estado_lote(n):
+    return np.full(n, np.inf), np.full(n, np.inf), np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+
+
+def observar_lote(tamanho, estado, janela=JANELA, paciencia=3 * JANELA):
+    anterior, menor, crescendo, sem_melhora = estado
+    crescendo = np.where(tamanho >= anterior, crescendo + 1, 0)
+    melhorou = tamanho < menor
+    menor = np.where(melhorou, tamanho, menor)
+    sem_melhora = np.where(melhorou, 0, sem_melhora + 1)
+    diverge = (crescendo >= janela) | (sem_melhora >= paciencia)
+    return (tamanho, menor, crescendo, sem_melhora), diverge
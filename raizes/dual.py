@@ -0,0 +1,196 @@
+import operator
+
+import numpy as np
+
+# ==========================================================
+# NÚMEROS DUAIS (DIFERENCIAÇÃO AUTOMÁTICA DIRETA)
+# ==========================================================
+# Dual(v, d) representa v + d·ε com ε² = 0: avaliar f em Dual(x, 1) dá
+# f(x) + f'(x)·ε, ou seja, o valor e a derivada exata (a menos de
+# arredondamento) numa única avaliação, sem df escrita à mão.
+# valor e derivada podem ser escalares ou arrays do NumPy (métodos em lote).
+#
+# f pode usar +, -, *, /, ** e as funções do NumPy (np.sin, np.log,
+# np.sqrt, np.arcsin...), que chegam aqui por __array_ufunc__. As funções do
+# módulo math convertem para float e não funcionam com Dual: o TypeError que
+# elas levantam vira um TypeError que diz para passar a derivada (df).
+# Comparações usam só o valor, então ramos como `if abs(c) <= 1` continuam
+# funcionando.
+
+
+class Dual:
+    __slots__ = ("valor", "derivada")
+
+    def __init__(self, valor, derivada=0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __add__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor + outro.valor, self.derivada + outro.derivada)
+        return Dual(self.valor + outro, self.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor - outro.valor, self.derivada - outro.derivada)
+        return Dual(self.valor - outro, self.derivada)
+
+    def __rsub__(self, outro):
+        return Dual(outro - self.valor, -self.derivada)
+
+    def __mul__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor * outro.valor, self.derivada * outro.valor + self.valor * outro.derivada)
+        return Dual(self.valor * outro, self.derivada * outro)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor / outro.valor,
+                        (self.derivada * outro.valor - self.valor * outro.derivada) / (outro.valor * outro.valor))
+        return Dual(self.valor / outro, self.derivada / outro)
+
+    def __rtruediv__(self, outro):
+        return Dual(outro / self.valor, -outro * self.derivada / (self.valor * self.valor))
+
+    def __pow__(self, expoente):
+        if isinstance(expoente, Dual):
+            valor = self.valor ** expoente.valor
+            return Dual(valor, valor * (expoente.derivada * np.log(self.valor)
+                                        + expoente.valor * self.derivada / self.valor))
+        return Dual(self.valor ** expoente, expoente * self.valor ** (expoente - 1) * self.derivada)
+
+    def __rpow__(self, base):
+        valor = base ** self.valor
+        return Dual(valor, valor * np.log(base) * self.derivada)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(abs(self.valor), np.sign(self.valor) * self.derivada)
+
+    def __lt__(self, outro):
+        return self.valor < _valor(outro)
+
+    def __le__(self, outro):
+        return self.valor <= _valor(outro)
+
+    def __gt__(self, outro):
+        return self.valor > _valor(outro)
+
+    def __ge__(self, outro):
+        return self.valor >= _valor(outro)
+
+    def __array_ufunc__(self, ufunc, metodo, *entradas, **kwargs):
+        if metodo != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in _BINARIAS:
+            # constantes viram Dual(c, 0) para não voltar ao NumPy (e a este método)
+            a, b = (e if isinstance(e, Dual) else Dual(e) for e in entradas)
+            return _BINARIAS[ufunc](a, b)
+        if ufunc in _DERIVADAS:
+            x, = entradas
+            valor = ufunc(x.valor)
+            return Dual(valor, _DERIVADAS[ufunc](x.valor, valor) * x.derivada)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+
+def _valor(x):
+    return x.valor if isinstance(x, Dual) else x
+
+
+_BINARIAS = {
+    np.add: operator.add,
+    np.subtract: operator.sub,
+    np.multiply: operator.mul,
+    np.true_divide: operator.truediv,
+    np.power: operator.pow,
+}
+
+# derivada de cada função em termos de x e do valor já calculado y = u(x)
+_DERIVADAS = {
+    np.negative: lambda x, y: -1,
+    np.positive: lambda x, y: 1,
+    np.absolute: lambda x, y: np.sign(x),
+    np.square: lambda x, y: 2 * x,
+    np.sqrt: lambda x, y: 0.5 / y,
+    np.cbrt: lambda x, y: 1 / (3 * y * y),
+    np.exp: lambda x, y: y,
+    np.expm1: lambda x, y: y + 1,
+    np.log: lambda x, y: 1 / x,
+    np.log1p: lambda x, y: 1 / (1 + x),
+    np.log10: lambda x, y: 1 / (x * np.log(10)),
+    np.log2: lambda x, y: 1 / (x * np.log(2)),
+    np.sin: lambda x, y: np.cos(x),
+    np.cos: lambda x, y: -np.sin(x),
+    np.tan: lambda x, y: 1 + y * y,
+    np.arcsin: lambda x, y: 1 / np.sqrt(1 - x * x),
+    np.arccos: lambda x, y: -1 / np.sqrt(1 - x * x),
+    np.arctan: lambda x, y: 1 / (1 + x * x),
+    np.sinh: lambda x, y: np.cosh(x),
+    np.cosh: lambda x, y: np.sinh(x),
+    np.tanh: lambda x, y: 1 - y * y,
+}
+
+
+# ==========================================================
+# VALOR E DERIVADA
+# ==========================================================
+
+def _avaliar(f, x, *args):
+    try:
+        return f(x, *args)
+    except TypeError as erro:
+        nome = getattr(f, "__name__", repr(f))
+        raise TypeError(f"{nome} não aceita números duais ({erro}): sem df, a derivada é calculada com "
+                        f"eles; passe df ou use as funções do NumPy em vez das do módulo math") from erro
+
+
+def valor_e_derivada(f, x, *args):
+    semente = np.ones_like(x) if isinstance(x, np.ndarray) else 1
+    resultado = _avaliar(f, Dual(x, semente), *args)
+    if not isinstance(resultado, Dual):
+        # f constante em x
+        return resultado, 0 * x
+    return resultado.valor, resultado.derivada
+
+
+def derivada(f):
+    return lambda x, *args: valor_e_derivada(f, x, *args)[1]
+
+
+# ==========================================================
+# DERIVADAS DE ORDEM SUPERIOR
+# ==========================================================
+# Duais aninhados: X = Dual(Dual(x, 1), 1) dá f(X) = Dual(Dual(f, f'),
+# Dual(f', f'')), e cada nível a mais acrescenta uma derivada. A k-ésima
+# derivada está no caminho com k passos por .derivada seguidos de .valor.
+# O custo dobra a cada ordem, o que é aceitável até a terceira.
+
+def _componente(v, caminho):
+    for parte in caminho:
+        if isinstance(v, Dual):
+            v = getattr(v, parte)
+        elif parte == "derivada":
+            # parte constante: derivada zero
+            return 0 * v
+    return v
+
+
+def derivadas(f, x, ordem, *args):
+    semente = x
+    for _ in range(ordem):
+        semente = Dual(semente, np.ones_like(x) if isinstance(x, np.ndarray) else 1)
+    resultado = _avaliar(f, semente, *args)
+    return tuple(_componente(resultado, ["derivada"] * k + ["valor"] * (ordem - k))
+                 for k in range(ordem + 1))
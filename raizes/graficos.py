@@ -0,0 +1,86 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# ==========================================================
+# GRÁFICOS
+# ==========================================================
+# Uma figura é descrita só com dados (dicionário criado por figura()), então
+# pode ser desenhada numa janela (mostrar) ou gravada em arquivo sem
+# interface gráfica (salvar), inclusive em processos separados.
+# Cada painel é um par (titulo, series), com series = {rótulo: valores};
+# rótulo None não entra na legenda. valores é a sequência de y (contra o
+# índice, como nas iterações) ou uma tupla (x, y).
+
+def figura(arquivo, titulo, paineis, xlabel="Iteração", ylabel="Aproximação", log=False):
+    return {
+        "arquivo": arquivo,
+        "titulo": titulo,
+        "paineis": paineis,
+        "xlabel": xlabel,
+        "ylabel": ylabel,
+        "log": log,
+    }
+
+
+def _grade(n):
+    colunas = min(n, 3)
+    return math.ceil(n / colunas), colunas
+
+
+def _tamanho(spec):
+    linhas, colunas = _grade(len(spec["paineis"]))
+    return (4.5 * colunas, 3.2 * linhas)
+
+
+def _desenhar(fig, spec):
+    n = len(spec["paineis"])
+    linhas, colunas = _grade(n)
+    eixos = fig.subplots(linhas, colunas, squeeze=False).ravel()
+
+    for eixo, (titulo, series) in zip(eixos, spec["paineis"]):
+        for rotulo, valores in series.items():
+            if not isinstance(valores, tuple):
+                valores = (valores,)
+            eixo.plot(*[np.asarray(v, dtype=np.float64) for v in valores], label=rotulo)
+        eixo.set_title(titulo, fontsize=9)
+        eixo.set_xlabel(spec["xlabel"])
+        eixo.set_ylabel(spec["ylabel"])
+        if spec["log"]:
+            eixo.set_yscale("log")
+        eixo.grid(True)
+        if any(rotulo is not None for rotulo in series):
+            eixo.legend(fontsize=8)
+
+    for eixo in eixos[n:]:
+        eixo.set_visible(False)
+    fig.suptitle(spec["titulo"])
+
+
+def _renderizar(spec, pasta):
+    # Figure sem pyplot: desenha direto no backend Agg, sem janela
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=_tamanho(spec), layout="constrained")
+    _desenhar(fig, spec)
+    caminho = os.path.join(pasta, spec["arquivo"])
+    fig.savefig(caminho, dpi=100)
+    return caminho
+
+
+def salvar(figuras, pasta="resultados/graficos", processos=1):
+    os.makedirs(pasta, exist_ok=True)
+    if processos == 1 or len(figuras) <= 1:
+        return [_renderizar(spec, pasta) for spec in figuras]
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        return list(executor.map(_renderizar, figuras, [pasta] * len(figuras)))
+
+
+def mostrar(figuras):
+    import matplotlib.pyplot as plt
+
+    for spec in figuras:
+        _desenhar(plt.figure(figsize=_tamanho(spec), layout="constrained"), spec)
+    plt.show()
@@ -0,0 +1,43 @@
+import numpy as np
+
+# ==========================================================
+# HISTÓRICO DE ITERAÇÕES
+# ==========================================================
+# Os iterados são gravados num buffer do NumPy alocado uma única vez.
+# manter:
+#   True  → todos os iterados (buffer de max_iter posições, cortado no fim);
+#   False → nenhum (só conta as iterações);
+#   k     → apenas os k últimos (buffer circular), o suficiente para o
+#           diagnóstico, que só usa os dois últimos.
+
+class Historico:
+    __slots__ = ("buffer", "n", "registrar")
+
+    def __init__(self, max_iter, manter=True, dtype=np.float64):
+        self.n = 0
+        if manter is True:
+            self.buffer = np.empty(max_iter, dtype=dtype)
+            self.registrar = self._registrar_todos
+        elif manter is False or manter <= 0:
+            self.buffer = np.empty(0, dtype=dtype)
+            self.registrar = self._contar
+        else:
+            self.buffer = np.empty(min(int(manter), max_iter), dtype=dtype)
+            self.registrar = self._registrar_ultimos
+
+    def _registrar_todos(self, x):
+        self.buffer[self.n] = x
+        self.n += 1
+
+    def _registrar_ultimos(self, x):
+        self.buffer[self.n % len(self.buffer)] = x
+        self.n += 1
+
+    def _contar(self, x):
+        self.n += 1
+
+    def valores(self):
+        k = len(self.buffer)
+        if self.n <= k or k == 0:
+            return self.buffer[:self.n].copy()
+        return np.roll(self.buffer, -(self.n % k))
@@ -0,0 +1,259 @@
+import numpy as np
+
+from .divergencia import JANELA, contracao, estado_lote, observar_lote
+from .dual import valor_e_derivada
+from .precisao import dtype_lote
+from .resultado import CONVERGIU, MAX_ITER, FALHOU, ESTAGNOU, DIVERGIU, marcar_parados
+
+# ==========================================================
+# MÉTODOS EM LOTE (VETORIZADOS)
+# ==========================================================
+# Cada método recebe arrays de intervalos ou chutes e avança todos os
+# problemas juntos. f, df e g precisam aceitar arrays do NumPy
+# (ex.: x**3 - 7*x + 6, np.log(x + 1) + x - 2).
+# Parâmetros extras por problema podem ser passados em args: são arrays
+# combinados (broadcast) com as entradas e entregues como f(x, *args).
+# tipo escolhe o dtype dos arrays ("float64", "float32", "float16" ou
+# "longdouble"); com float32/float16 cada operação processa mais elementos
+# por instrução, desde que f preserve o dtype (funções do NumPy preservam).
+# Retorno: (raizes, iteracoes, status), todos com o formato das entradas.
+# Como nos métodos escalares (ver tolerancia.py), um problema que chega ao
+# piso da precisão sem atingir tol sai do lote com ESTAGNOU: na bissecção,
+# quando o ponto médio coincide com um extremo (intervalo de uma ULP); na
+# falsa posição e em Illinois, também quando o passo fica abaixo de
+# eps·max(|x|, 1); em Newton, Secante e Ponto Fixo, só por esse passo. O
+# teste vem antes do vigia de divergência, então um patamar no piso da
+# precisão (passos que não diminuem porque já não há o que diminuir) não
+# é tomado por divergência.
+# Newton, Secante e Ponto Fixo também retiram do lote, com status DIVERGIU, os
+# problemas cujo |Δx| não diminui por JANELA iterações seguidas ou (exceto na
+# Secante) não melhora há muitas iterações (ver divergencia.py), em vez de
+# iterá-los até max_iter.
+
+def _preparar(dtype, *valores):
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=dtype) for v in valores])
+    formato = arrays[0].shape
+    return formato, [a.ravel().copy() for a in arrays]
+
+
+def _saidas(n, dtype):
+    raizes = np.full(n, np.nan, dtype=dtype)
+    iteracoes = np.zeros(n, dtype=np.int64)
+    status = np.full(n, MAX_ITER, dtype=np.int8)
+    return raizes, iteracoes, status
+
+
+def _finalizar(formato, raizes, iteracoes, status):
+    return raizes.reshape(formato), iteracoes.reshape(formato), status.reshape(formato)
+
+
+def _parado(passo, x, eps):
+    # passo abaixo da resolução do tipo: o iterado não muda mais
+    return np.abs(passo) <= eps * np.maximum(np.abs(x), 1)
+
+
+# ==========================================================
+# BISSECÇÃO
+# ==========================================================
+
+def bisseccao(f, inicio, fim, tol=1e-6, max_iter=100, args=(), tipo="float64"):
+    dtype = dtype_lote(tipo)
+    formato, (a, b, *p) = _preparar(dtype, inicio, fim, *args)
+    raizes, iteracoes, status = _saidas(a.size, dtype)
+    idx = np.arange(a.size)
+
+    with np.errstate(all="ignore"):
+        fa = f(a, *p)
+        for i in range(max_iter):
+            m = (a + b) / 2
+            fm = f(m, *p)
+            raizes[idx] = m
+            iteracoes[idx] = i + 1
+
+            conv = np.abs(fm) < tol
+            falha = ~(np.isfinite(m) & np.isfinite(fm))
+            estagnou = (m == a) | (m == b)
+            ativos = marcar_parados(status, idx, conv, falha, estagnou)
+
+            esquerda = fa * fm < 0
+            b = np.where(esquerda, m, b)
+            a = np.where(esquerda, a, m)
+            fa = np.where(esquerda, fa, fm)
+
+            idx, a, b, fa = idx[ativos], a[ativos], b[ativos], fa[ativos]
+            p = [v[ativos] for v in p]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status)
+
+
+# ==========================================================
+# FALSA POSIÇÃO E ILLINOIS
+# ==========================================================
+# Como em metodos.py, Illinois é a falsa posição em que o extremo que
+# permanece tem seu valor dividido por 2.
+
+def _falsa_posicao(f, inicio, fim, tol, max_iter, args, tipo, illinois):
+    dtype = dtype_lote(tipo)
+    formato, (a, b, *p) = _preparar(dtype, inicio, fim, *args)
+    raizes, iteracoes, status = _saidas(a.size, dtype)
+    idx = np.arange(a.size)
+
+    eps = np.finfo(dtype).eps
+    anterior = a
+
+    with np.errstate(all="ignore"):
+        fa, fb = f(a, *p), f(b, *p)
+        for i in range(max_iter):
+            m = (a * fb - b * fa) / (fb - fa)
+            fm = f(m, *p)
+            raizes[idx] = m
+            iteracoes[idx] = i + 1
+
+            conv = np.abs(fm) < tol
+            falha = ~(np.isfinite(m) & np.isfinite(fm))
+            meio = (a + b) / 2
+            estagnou = (meio == a) | (meio == b) | _parado(m - anterior, m, eps)
+            ativos = marcar_parados(status, idx, conv, falha, estagnou)
+
+            esquerda = fa * fm < 0
+            if illinois:
+                fa, fb = np.where(esquerda, fa / 2, fa), np.where(esquerda, fb, fb / 2)
+            b, fb = np.where(esquerda, m, b), np.where(esquerda, fm, fb)
+            a, fa = np.where(esquerda, a, m), np.where(esquerda, fa, fm)
+
+            idx, a, b, fa, fb = idx[ativos], a[ativos], b[ativos], fa[ativos], fb[ativos]
+            anterior = m[ativos]
+            p = [v[ativos] for v in p]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status)
+
+
+def falsa_posicao(f, inicio, fim, tol=1e-6, max_iter=100, args=(), tipo="float64"):
+    return _falsa_posicao(f, inicio, fim, tol, max_iter, args, tipo, illinois=False)
+
+
+def illinois(f, inicio, fim, tol=1e-6, max_iter=100, args=(), tipo="float64"):
+    return _falsa_posicao(f, inicio, fim, tol, max_iter, args, tipo, illinois=True)
+
+
+# ==========================================================
+# NEWTON
+# ==========================================================
+# Sem df (df=None), f é avaliada em números duais com arrays (dual.py):
+# cada avaliação dá f e f' de todos os problemas ativos. Com df, avaliar
+# chama f e df no mesmo ponto.
+
+def newton(f, df=None, chute=None, tol=1e-6, max_iter=100, args=(), tipo="float64"):
+    if chute is None:
+        raise TypeError("newton: falta o chute inicial")
+    dtype = dtype_lote(tipo)
+    if df is None:
+        avaliar = lambda x, *p: valor_e_derivada(f, x, *p)
+    else:
+        avaliar = lambda x, *p: (f(x, *p), df(x, *p))
+    formato, (x, *p) = _preparar(dtype, chute, *args)
+    raizes, iteracoes, status = _saidas(x.size, dtype)
+    idx = np.arange(x.size)
+
+    vigia = estado_lote(x.size)
+    eps = np.finfo(dtype).eps
+
+    with np.errstate(all="ignore"):
+        fx, dfx = avaliar(x, *p)
+        for i in range(max_iter):
+            proximo = x - fx / dfx
+            fp, dfp = avaliar(proximo, *p)
+            raizes[idx] = proximo
+            iteracoes[idx] = i + 1
+
+            conv = np.abs(fp) < tol
+            falha = ~(np.isfinite(proximo) & np.isfinite(fp))
+            tamanho = np.abs(proximo - x)
+            vigia, diverge = observar_lote(tamanho, vigia)
+            ativos = marcar_parados(status, idx, conv, falha, _parado(tamanho, proximo, eps), diverge)
+
+            idx, x, fx, dfx = idx[ativos], proximo[ativos], fp[ativos], dfp[ativos]
+            vigia = tuple(v[ativos] for v in vigia)
+            p = [v[ativos] for v in p]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status)
+
+
+# ==========================================================
+# SECANTE
+# ==========================================================
+
+def secante(f, chute1, chute2, tol=1e-6, max_iter=100, args=(), tipo="float64"):
+    dtype = dtype_lote(tipo)
+    formato, (x0, x1, *p) = _preparar(dtype, chute1, chute2, *args)
+    raizes, iteracoes, status = _saidas(x0.size, dtype)
+    idx = np.arange(x0.size)
+
+    vigia = estado_lote(x0.size)
+    eps = np.finfo(dtype).eps
+
+    with np.errstate(all="ignore"):
+        f0, f1 = f(x0, *p), f(x1, *p)
+        for i in range(max_iter):
+            x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+            f2 = f(x2, *p)
+            raizes[idx] = x2
+            iteracoes[idx] = i + 1
+
+            conv = np.abs(f2) < tol
+            falha = ~(np.isfinite(x2) & np.isfinite(f2))
+            tamanho = np.abs(x2 - x1)
+            vigia, diverge = observar_lote(tamanho, vigia, paciencia=np.inf)
+            ativos = marcar_parados(status, idx, conv, falha, _parado(tamanho, x2, eps), diverge)
+
+            idx = idx[ativos]
+            vigia = tuple(v[ativos] for v in vigia)
+            p = [v[ativos] for v in p]
+            x0, f0 = x1[ativos], f1[ativos]
+            x1, f1 = x2[ativos], f2[ativos]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status)
+
+
+# ==========================================================
+# PONTO FIXO
+# ==========================================================
+# Pré-voo: |g'(x0)| por números duais; onde passa de 1, basta um passo que
+# não diminui para retirar o problema.
+
+def ponto_fixo(g, chute, tol=1e-6, max_iter=100, args=(), tipo="float64"):
+    dtype = dtype_lote(tipo)
+    formato, (x, *p) = _preparar(dtype, chute, *args)
+    raizes, iteracoes, status = _saidas(x.size, dtype)
+    idx = np.arange(x.size)
+    vigia = estado_lote(x.size)
+    eps = np.finfo(dtype).eps
+
+    with np.errstate(all="ignore"):
+        janela = np.where(contracao(g, x, *p) > 1, 1, JANELA)
+        for i in range(max_iter):
+            proximo = g(x, *p)
+            raizes[idx] = proximo
+            iteracoes[idx] = i + 1
+
+            tamanho = np.abs(proximo - x)
+            conv = tamanho < tol
+            falha = ~np.isfinite(proximo)
+            vigia, diverge = observar_lote(tamanho, vigia, janela)
+            ativos = marcar_parados(status, idx, conv, falha, _parado(tamanho, proximo, eps), diverge)
+
+            idx, x = idx[ativos], proximo[ativos]
+            vigia, janela = tuple(v[ativos] for v in vigia), janela[ativos]
+            p = [v[ativos] for v in p]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status)
@@ -0,0 +1,687 @@
+import math
+import time
+
+from .divergencia import valor_e_contracao, vigia
+from .dual import derivada, derivadas, valor_e_derivada
+from .historico import Historico
+from .precisao import precisao
+from .resultado import Resultado, CONVERGIU, MAX_ITER, FALHOU, ESTAGNOU
+from .tolerancia import teste_passo, tolerancia
+
+# ==========================================================
+# MÉTODOS ESCALARES
+# ==========================================================
+# Todos os métodos:
+#   - param com |f(x)| < tol (ponto fixo: |x_novo - x| < tol), ou pelos
+#     critérios combinados de uma Tolerancia, e com status ESTAGNOU quando o
+#     iterado para de mudar ou o intervalo chega a uma ULP (ver tolerancia.py);
+#   - os que não têm intervalo (Newton, Secante, Ponto Fixo, Halley e
+#     Householder) param cedo com DIVERGIU ou CICLO quando os passos param de
+#     diminuir ou os iterados se repetem (ver divergencia.py);
+#   - reaproveitam os valores de f já calculados;
+#   - medem o tempo com time.perf_counter;
+#   - devolvem um Resultado (raiz, iteracoes, avaliacoes, tempo, status, historico).
+# historico controla os iterados guardados: True (todos), False (nenhum) ou
+# k (os k últimos); ver historico.py.
+# tipo escolhe a precisão dos iterados ("float64", "float32", "float16",
+# "longdouble", "fraction", "decimal:d", "trunc:k", "arred:k" ou um objeto
+# Precisao); ver precisao.py.
+#
+# Cada método também existe como gerador (iterar_<metodo>), que produz um
+# registro (x, f(x), passo) por iteração e termina devolvendo
+# (raiz, status, avaliacoes) em StopIteration.value. passo é a variação em
+# relação ao iterado anterior (na bissecção, falsa posição e Illinois, o
+# primeiro é medido a partir de inicio). Quem consome pode parar quando
+# quiser, acompanhar o progresso ou gravar os iterados sem guardar o
+# histórico em memória; as funções que devolvem Resultado são só um laço
+# sobre o gerador.
+
+def _resolver(iterados, p, max_iter, historico):
+    hist = Historico(max_iter, historico, p.dtype)
+    registrar = hist.registrar
+    t_inicio = time.perf_counter()
+    try:
+        with p.ativar():
+            while True:
+                registrar(next(iterados)[0])
+    except StopIteration as fim:
+        raiz, status, avaliacoes = fim.value
+    return Resultado(raiz, hist.n, avaliacoes, time.perf_counter() - t_inicio, status, hist.valores())
+
+
+def _parada(t, p, observar=None):
+    # devolve parar(residuo, limite, passo, x), comum a todos os geradores:
+    # CONVERGIU se |residuo| < limite, FALHOU se o resíduo não é finito,
+    # depois o teste de passo/estagnação (tolerancia.py) e, nos métodos sem
+    # intervalo, o vigia de divergência (divergencia.py); senão None
+    passo_ok = teste_passo(t, p)
+
+    def parar(residuo, limite, passo, x):
+        if abs(residuo) < limite:
+            return CONVERGIU
+        if not math.isfinite(residuo):
+            return FALHOU
+        status = passo_ok(passo, x)
+        if status is None and observar is not None:
+            status = observar(x, passo)
+        return status
+    return parar
+
+
+# ==========================================================
+# BISSECÇÃO
+# ==========================================================
+
+def iterar_bisseccao(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64"):
+    p, t = precisao(tipo), tolerancia(tol)
+    arred, f = p.converter, p.funcao(f)
+    parar = _parada(t, p)
+    status = MAX_ITER
+
+    a, b = arred(inicio), arred(fim)
+    fa = f(a)
+    n_f = 1
+    tol_f = t.limite_residuo(fa)
+    m = a
+
+    for i in range(max_iter):
+        anterior, m = m, arred((a + b) / 2)
+        if m == a or m == b:
+            # nenhum ponto representável entre a e b
+            status = ESTAGNOU
+            m = anterior
+            break
+        fm = f(m)
+        n_f += 1
+        yield m, fm, m - anterior
+
+        parada = parar(fm, tol_f, m - anterior, m)
+        if parada is not None:
+            status = parada
+            break
+
+        if fa * fm < 0:
+            b = m
+        else:
+            a, fa = m, fm
+
+    return m, status, (n_f, 0)
+
+
+def bisseccao(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_bisseccao(f, inicio, fim, tol, max_iter, p), p, max_iter, historico)
+
+
+# ==========================================================
+# FALSA POSIÇÃO E ILLINOIS
+# ==========================================================
+# Illinois é a falsa posição em que o extremo que permanece tem seu valor
+# dividido por 2, o que evita que um dos extremos fique parado.
+
+def _iterar_falsa_posicao(f, inicio, fim, tol, max_iter, tipo, illinois):
+    p, t = precisao(tipo), tolerancia(tol)
+    arred, f = p.converter, p.funcao(f)
+    parar = _parada(t, p)
+    status = MAX_ITER
+
+    a, b = arred(inicio), arred(fim)
+    fa, fb = f(a), f(b)
+    n_f = 2
+    tol_f = t.limite_residuo(max(abs(fa), abs(fb)))
+    m = a
+
+    for i in range(max_iter):
+        if fb == fa:
+            status = FALHOU
+            break
+        meio = arred((a + b) / 2)
+        if meio == a or meio == b:
+            # nenhum ponto representável entre a e b
+            status = ESTAGNOU
+            break
+
+        anterior, m = m, arred((a * fb - b * fa) / (fb - fa))
+        fm = f(m)
+        n_f += 1
+        yield m, fm, m - anterior
+
+        parada = parar(fm, tol_f, m - anterior, m)
+        if parada is not None:
+            status = parada
+            break
+
+        if fa * fm < 0:
+            b, fb = m, fm
+            if illinois:
+                fa = fa / 2
+        else:
+            a, fa = m, fm
+            if illinois:
+                fb = fb / 2
+
+    return m, status, (n_f, 0)
+
+
+def iterar_falsa_posicao(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64"):
+    return (yield from _iterar_falsa_posicao(f, inicio, fim, tol, max_iter, tipo, illinois=False))
+
+
+def iterar_illinois(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64"):
+    return (yield from _iterar_falsa_posicao(f, inicio, fim, tol, max_iter, tipo, illinois=True))
+
+
+def falsa_posicao(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_falsa_posicao(f, inicio, fim, tol, max_iter, p), p, max_iter, historico)
+
+
+def illinois(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_illinois(f, inicio, fim, tol, max_iter, p), p, max_iter, historico)
+
+
+# ==========================================================
+# NEWTON
+# ==========================================================
+# Sem df (df=None), f é avaliada em números duais (ver dual.py): cada
+# avaliação dá f(x) e f'(x) juntos e conta como uma avaliação de f.
+
+def _iterar_newton_dual(f, chute, t, max_iter, p):
+    arred = p.converter
+    parar = _parada(t, p, vigia())
+    if p.exato:
+        avaliar = lambda x: tuple(map(arred, valor_e_derivada(f, x)))
+    else:
+        avaliar = lambda x: valor_e_derivada(f, x)
+    status = MAX_ITER
+
+    x = arred(chute)
+    fx, dfx = avaliar(x)
+    n_f = 1
+    tol_f = t.limite_residuo(fx)
+
+    for i in range(max_iter):
+        if dfx == 0:
+            status = FALHOU
+            break
+
+        anterior, x = x, arred(x - fx / dfx)
+        fx, dfx = avaliar(x)
+        n_f += 1
+        yield x, fx, x - anterior
+
+        parada = parar(fx, tol_f, x - anterior, x)
+        if parada is not None:
+            status = parada
+            break
+
+    return x, status, (n_f, 0)
+
+
+def iterar_newton(f, df=None, chute=None, tol=1e-6, max_iter=100, tipo="float64"):
+    if chute is None:
+        raise TypeError("newton: falta o chute inicial")
+    p, t = precisao(tipo), tolerancia(tol)
+    if df is None:
+        return (yield from _iterar_newton_dual(f, chute, t, max_iter, p))
+    arred, f, df = p.converter, p.funcao(f), p.funcao(df)
+    parar = _parada(t, p, vigia())
+    status = MAX_ITER
+
+    x = arred(chute)
+    fx = f(x)
+    n_f, n_df = 1, 0
+    tol_f = t.limite_residuo(fx)
+
+    for i in range(max_iter):
+        dfx = df(x)
+        n_df += 1
+        if dfx == 0:
+            status = FALHOU
+            break
+
+        anterior, x = x, arred(x - fx / dfx)
+        fx = f(x)
+        n_f += 1
+        yield x, fx, x - anterior
+
+        parada = parar(fx, tol_f, x - anterior, x)
+        if parada is not None:
+            status = parada
+            break
+
+    return x, status, (n_f, n_df)
+
+
+def newton(f, df=None, chute=None, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_newton(f, df, chute, tol, max_iter, p), p, max_iter, historico)
+
+
+# ==========================================================
+# SECANTE
+# ==========================================================
+
+def iterar_secante(f, chute1, chute2, tol=1e-6, max_iter=100, tipo="float64"):
+    p, t = precisao(tipo), tolerancia(tol)
+    arred, f = p.converter, p.funcao(f)
+    parar = _parada(t, p, vigia(paciencia=math.inf))
+    status = MAX_ITER
+
+    x0, x1 = arred(chute1), arred(chute2)
+    f0, f1 = f(x0), f(x1)
+    n_f = 2
+    tol_f = t.limite_residuo(max(abs(f0), abs(f1)))
+
+    for i in range(max_iter):
+        if f1 == f0:
+            status = FALHOU
+            break
+
+        x2 = arred(x1 - f1 * (x1 - x0) / (f1 - f0))
+        f2 = f(x2)
+        n_f += 1
+        yield x2, f2, x2 - x1
+
+        x0, x1 = x1, x2
+        f0, f1 = f1, f2
+
+        parada = parar(f1, tol_f, x1 - x0, x1)
+        if parada is not None:
+            status = parada
+            break
+
+    return x1, status, (n_f, 0)
+
+
+def secante(f, chute1, chute2, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_secante(f, chute1, chute2, tol, max_iter, p), p, max_iter, historico)
+
+
+# ==========================================================
+# PONTO FIXO
+# ==========================================================
+# No registro do gerador, f(x) é o resíduo g(x) - x do iterado anterior,
+# que coincide com o passo.
+#
+# aceleracao (a mesma g, sem derivada):
+#   None         → x_{k+1} = g(x_k), convergência linear com razão |g'(x*)|;
+#   "aitken"     → a iteração comum continua, mas o iterado registrado é a
+#                  extrapolação Δ² de Aitken de cada trinca x_k, x_{k+1}, x_{k+2}
+#                  (mesma ordem, constante bem menor);
+#   "steffensen" → cada iteração faz dois passos de g e recomeça do valor
+#                  extrapolado: convergência quadrática, duas avaliações de g
+#                  por iteração.
+# Se o denominador x_{k+2} - 2x_{k+1} + x_k zerar, vale o último g calculado.
+# Numa Tolerancia, residuo e residuo_relativo valem para |x_novo - x| (o
+# resíduo do ponto fixo), relativo ao primeiro passo.
+
+def _extrapolar(x0, x1, x2, arred):
+    denominador = x2 - 2 * x1 + x0
+    if denominador == 0:
+        return x2
+    return arred(x0 - (x1 - x0) ** 2 / denominador)
+
+
+def _iterar_aitken(g, chute, t, max_iter, p):
+    arred = p.converter
+    parar = _parada(t, p, vigia())
+    status = MAX_ITER
+
+    x0 = arred(chute)
+    x1 = arred(g(x0))
+    x2 = arred(g(x1))
+    n_g = 2
+    tol_x = t.limite_residuo(x1 - x0)
+    x = x0
+
+    for i in range(max_iter):
+        proximo = _extrapolar(x0, x1, x2, arred)
+        passo = proximo - x
+        yield proximo, passo, passo
+
+        x = proximo
+        parada = parar(passo, tol_x, passo, x)
+        if parada is not None:
+            status = parada
+            break
+
+        try:
+            x0, x1, x2 = x1, x2, arred(g(x2))
+        except OverflowError:
+            status = FALHOU
+            break
+        n_g += 1
+
+    return x, status, (n_g, 0)
+
+
+def _iterar_steffensen(g, chute, t, max_iter, p):
+    arred = p.converter
+    parar = _parada(t, p, vigia())
+    status = MAX_ITER
+
+    x = arred(chute)
+    n_g = 0
+    tol_x = None
+
+    for i in range(max_iter):
+        try:
+            x1 = arred(g(x))
+            x2 = arred(g(x1))
+        except OverflowError:
+            status = FALHOU
+            break
+        n_g += 2
+        if tol_x is None:
+            tol_x = t.limite_residuo(x1 - x)
+        proximo = _extrapolar(x, x1, x2, arred)
+        passo = proximo - x
+        yield proximo, passo, passo
+
+        x = proximo
+        parada = parar(passo, tol_x, passo, x)
+        if parada is not None:
+            status = parada
+            break
+
+    return x, status, (n_g, 0)
+
+
+_ACELERACOES = {"aitken": _iterar_aitken, "steffensen": _iterar_steffensen}
+
+
+def iterar_ponto_fixo(g, chute, tol=1e-6, max_iter=100, tipo="float64", aceleracao=None):
+    p, t = precisao(tipo), tolerancia(tol)
+    if aceleracao is not None:
+        if aceleracao not in _ACELERACOES:
+            raise ValueError(f"aceleração desconhecida: {aceleracao!r}")
+        return (yield from _ACELERACOES[aceleracao](p.funcao(g), chute, t, max_iter, p))
+    arred = p.converter
+    x = arred(chute)
+    # pré-voo: |g'(x0)| > 1 indica que x0 se afasta do ponto fixo; a mesma
+    # avaliação dá g(x0), o primeiro iterado
+    primeiro, q = valor_e_contracao(g, x)
+    n_g = 0 if primeiro is None else 1
+    g = p.funcao(g)
+    parar = _parada(t, p, vigia(contracao=q))
+    status = MAX_ITER
+    tol_x = None
+
+    for i in range(max_iter):
+        if primeiro is not None:
+            proximo, primeiro = arred(primeiro), None
+        else:
+            try:
+                proximo = arred(g(x))
+            except OverflowError:
+                # g com operações do Python (math.exp, **) estoura em vez de dar inf
+                status = FALHOU
+                break
+            n_g += 1
+        passo = proximo - x
+        if tol_x is None:
+            tol_x = t.limite_residuo(passo)
+        yield proximo, passo, passo
+
+        x = proximo
+        parada = parar(passo, tol_x, passo, x)
+        if parada is not None:
+            status = parada
+            break
+
+    return x, status, (n_g, 0)
+
+
+def ponto_fixo(g, chute, tol=1e-6, max_iter=100, tipo="float64", historico=True, aceleracao=None):
+    p = precisao(tipo)
+    return _resolver(iterar_ponto_fixo(g, chute, tol, max_iter, p, aceleracao), p, max_iter, historico)
+
+
+# ==========================================================
+# BRENT
+# ==========================================================
+# Interpolação quadrática inversa / secante, com bissecção quando o passo
+# interpolado não reduz o intervalo o suficiente. Sem troca de sinal entre
+# f(inicio) e f(fim) não há raiz garantida e o método termina com FALHOU,
+# sem iterar. O intervalo só encolhe até a tolerância de passo da
+# Tolerancia (se houver) ou até a resolução do tipo; se isso acontece com
+# |f| ainda acima da tolerância, o status é ESTAGNOU, como em _parada.
+
+def iterar_brent(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64"):
+    p, t = precisao(tipo), tolerancia(tol)
+    arred, f = p.converter, p.funcao(f)
+    parar = _parada(t, p)
+    status = MAX_ITER
+    eps = p.eps
+    tol_x = arred(t.passo)
+
+    a, b = arred(inicio), arred(fim)
+    fa, fb = f(a), f(b)
+    n_f = 2
+    if fa * fb > 0:
+        return b, FALHOU, (n_f, 0)
+    tol_f = t.limite_residuo(max(abs(fa), abs(fb)))
+    c, fc = b, fb
+    d = e = b - a
+
+    for i in range(max_iter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, fa = b, fb
+            b, fb = c, fc
+            c, fc = a, fa
+
+        tol1 = 2 * eps * abs(b) + tol_x / 2
+        xm = (c - b) / 2
+        if abs(xm) <= tol1 or fb == 0:
+            # intervalo na tolerância de passo: CONVERGIU; só na resolução do tipo: ESTAGNOU
+            status = CONVERGIU if fb == 0 or abs(fb) < tol_f or t.passo else ESTAGNOU
+            break
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                numerador, denominador = 2 * xm * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                numerador = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                denominador = (q - 1) * (r - 1) * (s - 1)
+            if numerador > 0:
+                denominador = -denominador
+            numerador = abs(numerador)
+            if 2 * numerador < min(3 * xm * denominador - abs(tol1 * denominador), abs(e * denominador)):
+                e, d = d, numerador / denominador
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        if abs(d) > tol1:
+            b = arred(b + d)
+        else:
+            b = arred(b + tol1 if xm > 0 else b - tol1)
+        fb = f(b)
+        n_f += 1
+        yield b, fb, b - a
+
+        parada = parar(fb, tol_f, b - a, b)
+        if parada is not None:
+            status = parada
+            break
+
+    return b, status, (n_f, 0)
+
+
+def brent(f, inicio, fim, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_brent(f, inicio, fim, tol, max_iter, p), p, max_iter, historico)
+
+
+# ==========================================================
+# NEWTON-BISSECÇÃO
+# ==========================================================
+# Newton protegido: o passo só é aceito se cair dentro do intervalo que
+# contém a raiz; caso contrário é feita uma bissecção. df=None usa a
+# derivada automática (dual.py). Como no Brent, sem troca de sinal entre
+# f(inicio) e f(fim) o método termina com FALHOU, sem iterar, e com f = 0
+# num dos extremos devolve esse extremo com CONVERGIU.
+
+def iterar_newton_bisseccao(f, df, inicio, fim, tol=1e-6, max_iter=100, tipo="float64"):
+    p, t = precisao(tipo), tolerancia(tol)
+    if df is None:
+        df = derivada(f)
+    arred, f, df = p.converter, p.funcao(f), p.funcao(df)
+    parar = _parada(t, p)
+    status = MAX_ITER
+
+    a, b = arred(inicio), arred(fim)
+    fa, fb = f(a), f(b)
+    if fa * fb > 0:
+        return a, FALHOU, (2, 0)
+    # raiz num dos extremos, como no Brent
+    if fa == 0:
+        return a, CONVERGIU, (2, 0)
+    if fb == 0:
+        return b, CONVERGIU, (2, 0)
+    baixo, alto = (a, b) if fa < 0 else (b, a)
+
+    x = arred((a + b) / 2)
+    fx, dfx = f(x), df(x)
+    n_f, n_df = 3, 1
+    tol_f = t.limite_residuo(max(abs(fa), abs(fb)))
+    # o ponto médio já estreita o intervalo pela metade (se não for a raiz)
+    if fx < 0:
+        baixo = x
+    elif fx > 0:
+        alto = x
+
+    for i in range(max_iter):
+        proximo = x - fx / dfx if dfx != 0 else alto
+        if not (min(baixo, alto) < proximo < max(baixo, alto)):
+            proximo = arred((baixo + alto) / 2)
+            if proximo == baixo or proximo == alto:
+                # nenhum ponto representável entre os extremos
+                status = ESTAGNOU
+                break
+
+        anterior, x = x, arred(proximo)
+        fx = f(x)
+        n_f += 1
+        yield x, fx, x - anterior
+
+        parada = parar(fx, tol_f, x - anterior, x)
+        if parada is not None:
+            status = parada
+            break
+
+        if fx < 0:
+            baixo = x
+        else:
+            alto = x
+
+        dfx = df(x)
+        n_df += 1
+
+    return x, status, (n_f, n_df)
+
+
+def newton_bisseccao(f, df, inicio, fim, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_newton_bisseccao(f, df, inicio, fim, tol, max_iter, p), p, max_iter, historico)
+
+
+# ==========================================================
+# MÉTODOS DE ORDEM SUPERIOR (HALLEY E HOUSEHOLDER)
+# ==========================================================
+# Halley (ordem 3) usa f, f' e f''; Householder de ordem 4 usa também f'''.
+# As derivadas podem ser passadas (todas); se faltar alguma, todas vêm de
+# duais aninhados (dual.derivadas) numa única avaliação, contada como uma
+# avaliação de f. Com derivadas explícitas, avaliacoes[1] soma as
+# avaliações de todas elas. Como em Newton, as derivadas só são calculadas
+# depois de confirmar que o novo iterado ainda não convergiu.
+
+def _iterar_alta_ordem(f, funcoes_derivadas, ordem, passo, chute, t, max_iter, p):
+    arred = p.converter
+    parar = _parada(t, p, vigia())
+    automatico = any(d is None for d in funcoes_derivadas)
+    if automatico:
+        if p.exato:
+            avaliar = lambda x: [arred(v) for v in derivadas(f, x, ordem)]
+        else:
+            avaliar = lambda x: list(derivadas(f, x, ordem))
+    else:
+        f = p.funcao(f)
+        funcoes_derivadas = [p.funcao(d) for d in funcoes_derivadas]
+    status = MAX_ITER
+
+    x = arred(chute)
+    if automatico:
+        valores = avaliar(x)
+        n_f, n_df = 1, 0
+    else:
+        valores = [f(x)] + [d(x) for d in funcoes_derivadas]
+        n_f, n_df = 1, ordem
+    tol_f = t.limite_residuo(valores[0])
+
+    for i in range(max_iter):
+        numerador, denominador = passo(*valores)
+        if denominador == 0:
+            status = FALHOU
+            break
+
+        anterior, x = x, arred(x - numerador / denominador)
+        valores = avaliar(x) if automatico else [f(x)]
+        fx = valores[0]
+        n_f += 1
+        yield x, fx, x - anterior
+
+        parada = parar(fx, tol_f, x - anterior, x)
+        if parada is not None:
+            status = parada
+            break
+
+        if not automatico:
+            valores += [d(x) for d in funcoes_derivadas]
+            n_df += ordem
+
+    return x, status, (n_f, n_df)
+
+
+def _passo_halley(fx, d1, d2):
+    return 2 * fx * d1, 2 * d1 * d1 - fx * d2
+
+
+def _passo_householder(fx, d1, d2, d3):
+    return 6 * fx * d1 * d1 - 3 * fx * fx * d2, 6 * d1 * d1 * d1 - 6 * fx * d1 * d2 + fx * fx * d3
+
+
+def iterar_halley(f, df=None, d2f=None, chute=None, tol=1e-6, max_iter=100, tipo="float64"):
+    if chute is None:
+        raise TypeError("halley: falta o chute inicial")
+    p = precisao(tipo)
+    return (yield from _iterar_alta_ordem(f, [df, d2f], 2, _passo_halley, chute, tolerancia(tol), max_iter, p))
+
+
+def halley(f, df=None, d2f=None, chute=None, tol=1e-6, max_iter=100, tipo="float64", historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_halley(f, df, d2f, chute, tol, max_iter, p), p, max_iter, historico)
+
+
+def iterar_householder(f, df=None, d2f=None, d3f=None, chute=None, tol=1e-6, max_iter=100, tipo="float64"):
+    if chute is None:
+        raise TypeError("householder: falta o chute inicial")
+    p = precisao(tipo)
+    return (yield from _iterar_alta_ordem(f, [df, d2f, d3f], 3, _passo_householder, chute, tolerancia(tol),
+                                          max_iter, p))
+
+
+def householder(f, df=None, d2f=None, d3f=None, chute=None, tol=1e-6, max_iter=100, tipo="float64",
+                historico=True):
+    p = precisao(tipo)
+    return _resolver(iterar_householder(f, df, d2f, d3f, chute, tol, max_iter, p), p, max_iter, historico)
@@ -0,0 +1,121 @@
+import numpy as np
+
+from .compensado import horner_compensado
+
+# ==========================================================
+# POLINÔMIOS
+# ==========================================================
+# Coeficientes do maior para o menor grau, como no MATLAB e no NumPy:
+# Polinomio([1, 0, -7, 6]) é x³ - 7x + 6.
+#
+# Horner calcula p(x) e p'(x) na mesma passada (valor_e_derivada), para x
+# escalar ou array. Para os métodos, que chamam f e df separadamente, p.f e
+# p.df são funções comuns (clausuras com os coeficientes de p e de p'): no
+# CPython cada chamada a mais de função custa mais que a conta de um
+# polinômio pequeno, então guardar p' de uma chamada para a outra sai mais
+# caro que recalcular. O próprio Polinomio também pode ser chamado como f.
+
+def _horner(coeficientes):
+    primeiro, resto = coeficientes[0], tuple(coeficientes[1:])
+
+    def f(x):
+        p = primeiro
+        for c in resto:
+            p = p * x + c
+        return p
+    return f
+
+
+def _funcoes(coeficientes):
+    g = len(coeficientes) - 1
+    derivada = [c * (g - i) for i, c in enumerate(coeficientes[:-1])] or [0]
+    primeiro, resto = coeficientes[0], tuple(coeficientes[1:])
+
+    def valor_e_derivada(x):
+        p, dp = primeiro, 0
+        for c in resto:
+            dp = dp * x + p
+            p = p * x + c
+        return p, dp
+    return _horner(coeficientes), _horner(derivada), valor_e_derivada
+
+
+class Polinomio:
+    __slots__ = ("coeficientes", "f", "df", "valor_e_derivada")
+
+    def __init__(self, coeficientes):
+        # guardados como vieram: inteiros também funcionam com Fraction e Decimal
+        coeficientes = list(coeficientes)
+        if len(coeficientes) == 0 or (len(coeficientes) > 1 and coeficientes[0] == 0):
+            raise ValueError("o coeficiente do maior grau precisa ser não nulo")
+        self.coeficientes = coeficientes
+        self.f, self.df, self.valor_e_derivada = _funcoes(coeficientes)
+
+    @property
+    def grau(self):
+        return len(self.coeficientes) - 1
+
+    def __call__(self, x):
+        return self.f(x)
+
+    def compensado(self, x):
+        # Horner compensado (ver compensado.py): mais preciso perto de raízes
+        # múltiplas, para arrays ou escalares float64
+        return horner_compensado(self.coeficientes, x)
+
+    def derivada(self):
+        g = self.grau
+        return Polinomio([c * (g - i) for i, c in enumerate(self.coeficientes[:-1])] or [0])
+
+    def raizes(self, polir=2):
+        return raizes_polinomios([self.coeficientes], polir)[0]
+
+    def raizes_reais(self, tol=1e-10, polir=2):
+        r = self.raizes(polir)
+        return np.sort(r[np.abs(r.imag) <= tol * np.maximum(np.abs(r), 1)].real)
+
+    def __repr__(self):
+        return f"Polinomio({self.coeficientes!r})"
+
+
+# ==========================================================
+# TODAS AS RAÍZES DE MUITOS POLINÔMIOS
+# ==========================================================
+# coeficientes: array (n, grau + 1), um polinômio por linha, todos do mesmo
+# grau. As raízes são os autovalores das matrizes companheiras, calculados
+# de uma vez para a pilha inteira (n, grau, grau) pelo LAPACK; depois
+# `polir` passos de Newton (Horner complexo, vetorizado) corrigem o erro
+# do cálculo de autovalores. Um passo só é aceito se diminuir |p|.
+# Devolve um array complexo (n, grau).
+
+def _horner_linhas(coeficientes, z):
+    p = np.broadcast_to(coeficientes[:, :1], z.shape).astype(np.complex128)
+    dp = np.zeros_like(p)
+    for k in range(1, coeficientes.shape[1]):
+        dp = dp * z + p
+        p = p * z + coeficientes[:, k:k + 1]
+    return p, dp
+
+
+def raizes_polinomios(coeficientes, polir=2):
+    coeficientes = np.atleast_2d(np.asarray(coeficientes, dtype=np.float64))
+    n, g = coeficientes.shape[0], coeficientes.shape[1] - 1
+    if np.any(coeficientes[:, 0] == 0):
+        raise ValueError("o coeficiente do maior grau precisa ser não nulo")
+    if g == 0:
+        return np.empty((n, 0), dtype=np.complex128)
+
+    # matriz companheira: primeira linha -c[1:]/c[0], subdiagonal de uns
+    companheiras = np.zeros((n, g, g))
+    companheiras[:, 0, :] = -coeficientes[:, 1:] / coeficientes[:, :1]
+    companheiras[:, np.arange(1, g), np.arange(g - 1)] = 1
+    z = np.linalg.eigvals(companheiras).astype(np.complex128)
+
+    with np.errstate(all="ignore"):
+        for _ in range(polir):
+            p, dp = _horner_linhas(coeficientes, z)
+            novo = z - p / dp
+            p_novo, _ = _horner_linhas(coeficientes, novo)
+            melhor = np.isfinite(novo) & (np.abs(p_novo) < np.abs(p))
+            z = np.where(melhor, novo, z)
+    return z
@@ -0,0 +1,87 @@
+import functools
+
+import numpy as np
+
+# ==========================================================
+# PARÂMETROS DE MÁQUINA
+# ==========================================================
+# realmax, realmin e eps de cada tipo (como no MATLAB), calculados uma vez
+# por tipo e guardados em cache.
+
+TIPOS = ("float16", "float32", "float64", "longdouble")
+
+
+@functools.lru_cache(maxsize=None)
+def parametros(tipo):
+    info = np.finfo(np.dtype(tipo))
+    return {
+        "realmax": info.max,
+        "realmin": info.tiny,
+        "eps": info.eps,
+        "digitos": info.precision,
+        "bits_mantissa": info.nmant,
+    }
+
+
+# ==========================================================
+# SONDAS DE CANCELAMENTO
+# ==========================================================
+# Cada sonda é um par (forma instável, forma estável) da mesma expressão.
+# A instável é avaliada no tipo testado; a estável, em longdouble sobre o
+# mesmo x já arredondado para o tipo, e serve de referência (para o próprio
+# longdouble, a referência tem a mesma precisão, então erros de até ~1 ULP
+# são só arredondamento).
+
+SONDAS = {
+    "((1+x)-1)/x": (lambda x: ((1 + x) - 1) / x, np.ones_like),
+    "(sqrt(1+x)-1)/x": (lambda x: (np.sqrt(1 + x) - 1) / x, lambda x: 1 / (np.sqrt(1 + x) + 1)),
+    "(1+x)-x": (lambda x: (1 + x) - x, np.ones_like),
+}
+
+
+def erros(sonda, tipo, x):
+    # devolve (aproximado, erro absoluto, erro relativo, erro em ULPs), em float64;
+    # x que não cabe no tipo (vira 0 ou inf) dá nan
+    instavel, estavel = SONDAS[sonda]
+    dtype = np.dtype(tipo)
+    with np.errstate(all="ignore"):
+        x = np.asarray(x).astype(dtype)
+        aproximado = instavel(x)
+        referencia = estavel(x.astype(np.longdouble))
+        erro_abs = np.abs(aproximado.astype(np.longdouble) - referencia)
+        erro_rel = erro_abs / np.abs(referencia)
+        erro_ulp = erro_abs / np.spacing(np.abs(referencia).astype(dtype)).astype(np.longdouble)
+    invalido = (x == 0) | ~np.isfinite(x)
+    return tuple(np.where(invalido, np.nan, v.astype(np.float64))
+                 for v in (aproximado, erro_abs, erro_rel, erro_ulp))
+
+
+# ==========================================================
+# PERFIL DE ERRO
+# ==========================================================
+# `pontos` valores de x igualmente espaçados em log10, de 10^expoente_min a
+# 10^expoente_max, agrupados em `faixas` faixas consecutivas. Os pontos são
+# gerados e avaliados em blocos de faixas inteiras, e cada faixa guarda só o
+# pior erro, então milhões de pontos não ocupam memória proporcional.
+# Devolve um dicionário com log10_x (centro de cada faixa) e os arrays
+# erro_abs, erro_rel e erro_ulp (máximos por faixa; nan se a faixa inteira
+# não cabe no tipo).
+
+def perfil(sonda, tipo, expoente_min=-20, expoente_max=20, pontos=1_000_000, faixas=400,
+           tamanho_bloco=1 << 18):
+    por_faixa = max(pontos // faixas, 1)
+    total = por_faixa * faixas
+    passo = (expoente_max - expoente_min) / (total - 1) if total > 1 else 0.0
+    faixas_por_bloco = max(tamanho_bloco // por_faixa, 1)
+
+    saida = {chave: np.empty(faixas) for chave in ("erro_abs", "erro_rel", "erro_ulp")}
+    for inicio in range(0, faixas, faixas_por_bloco):
+        fim = min(inicio + faixas_por_bloco, faixas)
+        expoentes = expoente_min + np.arange(inicio * por_faixa, fim * por_faixa) * passo
+        _, *valores = erros(sonda, tipo, 10.0 ** expoentes)
+        for chave, v in zip(saida, valores):
+            # fmax ignora nan, a não ser que a faixa inteira seja nan
+            saida[chave][inicio:fim] = np.fmax.reduce(v.reshape(-1, por_faixa), axis=1)
+
+    centros = expoente_min + (np.arange(faixas) + 0.5) * por_faixa * passo
+    return {"log10_x": centros, **saida}
@@ -0,0 +1,144 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .historico import Historico
+from .metodos import iterar_bisseccao, iterar_illinois, iterar_newton, iterar_secante
+from .precisao import precisao
+from .tolerancia import tolerancia
+from .resultado import Resultado, CONVERGIU, FALHOU
+
+# ==========================================================
+# PORTFÓLIO DE MÉTODOS
+# ==========================================================
+# Newton, Secante, Illinois e Bissecção correm no mesmo problema e o
+# primeiro que convergir encerra os outros, então o tempo é o do método mais
+# rápido em vez da soma de todos. A Secante parte de inicio e fim; Newton, de
+# chute (padrão: ponto médio). Sem df (df=None), Newton usa a derivada
+# automática (dual.py); se f não aceitar números duais (funções do módulo
+# math), Newton sai da corrida com FALHOU e os outros continuam.
+#
+# modo:
+#   "intercalado" → uma iteração de cada método por rodada, no processo atual
+#                   (melhor para f barata);
+#   "threads"     → cada método numa thread (para f cara que libera o GIL,
+#                   como NumPy, E/S ou chamadas externas); os perdedores
+#                   param na iteração seguinte à vitória.
+#
+# Devolve (vencedor, resultado): o nome do método e o seu Resultado, com o
+# tempo total da corrida. Se nenhum convergir, vence o de menor |f| final.
+# avaliacoes soma as de todos os métodos da corrida, inclusive as dos
+# perdedores interrompidos: é o custo real do portfólio (cada método conta
+# as chamadas da sua própria cópia de f e df).
+
+def _contar(funcao, contagem, i):
+    def contada(x):
+        contagem[i] += 1
+        return funcao(x)
+    return contada
+
+
+def _sem_dual(gerador, chute):
+    # Newton com derivada automática numa f que não aceita Dual
+    try:
+        return (yield from gerador)
+    except (TypeError, AttributeError):
+        return chute, FALHOU, (0, 0)
+
+
+def _geradores(f, df, inicio, fim, chute, tol, max_iter, p, contagens):
+    if chute is None:
+        chute = (inicio + fim) / 2
+    contadas = {}
+    for nome in ("Newton", "Secante", "Illinois", "Bissecção"):
+        contagens[nome] = [0, 0]
+        contadas[nome] = _contar(f, contagens[nome], 0)
+    geradores = {}
+    if df is not None:
+        geradores["Newton"] = iterar_newton(contadas["Newton"], _contar(df, contagens["Newton"], 1), chute, tol,
+                                            max_iter, p)
+    else:
+        geradores["Newton"] = _sem_dual(iterar_newton(contadas["Newton"], None, chute, tol, max_iter, p), chute)
+    geradores["Secante"] = iterar_secante(contadas["Secante"], inicio, fim, tol, max_iter, p)
+    geradores["Illinois"] = iterar_illinois(contadas["Illinois"], inicio, fim, tol, max_iter, p)
+    geradores["Bissecção"] = iterar_bisseccao(contadas["Bissecção"], inicio, fim, tol, max_iter, p)
+    return geradores
+
+
+def _intercalar(geradores, historicos, tol, p):
+    ativos = dict(geradores)
+    finais, residuos = {}, {}
+    with p.ativar():
+        while ativos:
+            for nome, gerador in list(ativos.items()):
+                try:
+                    x, fx, passo = next(gerador)
+                    historicos[nome].registrar(x)
+                    residuos[nome] = abs(fx)
+                    if abs(fx) < tol:
+                        # os quatro métodos param com |f| < tol, mas o gerador
+                        # só devolve o resultado no próximo next()
+                        next(gerador)
+                except StopIteration as fim:
+                    finais[nome] = fim.value
+                    del ativos[nome]
+                    if fim.value[1] == CONVERGIU:
+                        for perdedor in ativos.values():
+                            perdedor.close()
+                        return nome, finais, residuos
+        return None, finais, residuos
+
+
+def _correr(nome, gerador, historico, parar, chegada, p):
+    residuo = float('inf')
+    try:
+        with p.ativar():
+            while not parar.is_set():
+                x, fx, passo = next(gerador)
+                historico.registrar(x)
+                residuo = abs(fx)
+    except StopIteration as fim:
+        if fim.value[1] == CONVERGIU:
+            chegada.append(nome)
+            parar.set()
+        return fim.value, residuo
+    gerador.close()
+    return None, residuo
+
+
+def _threads(geradores, historicos, p):
+    parar = threading.Event()
+    chegada = []
+    with ThreadPoolExecutor(max_workers=len(geradores)) as executor:
+        tarefas = {nome: executor.submit(_correr, nome, gerador, historicos[nome], parar, chegada, p)
+                   for nome, gerador in geradores.items()}
+    finais, residuos = {}, {}
+    for nome, tarefa in tarefas.items():
+        final, residuos[nome] = tarefa.result()
+        if final is not None:
+            finais[nome] = final
+    return (chegada[0] if chegada else None), finais, residuos
+
+
+def portfolio(f, df, inicio, fim, chute=None, tol=1e-6, max_iter=100, tipo="float64",
+              historico=True, modo="intercalado"):
+    p, t = precisao(tipo), tolerancia(tol)
+    contagens = {}
+    geradores = _geradores(f, df, inicio, fim, chute, t, max_iter, p, contagens)
+    historicos = {nome: Historico(max_iter, historico, p.dtype) for nome in geradores}
+    t_inicio = time.perf_counter()
+
+    if modo == "intercalado":
+        vencedor, finais, residuos = _intercalar(geradores, historicos, t.residuo, p)
+    elif modo == "threads":
+        vencedor, finais, residuos = _threads(geradores, historicos, p)
+    else:
+        raise ValueError(f"modo desconhecido: {modo!r}")
+    tempo = time.perf_counter() - t_inicio
+
+    if vencedor is None:
+        vencedor = min(finais, key=lambda nome: residuos.get(nome, float('inf')))
+    raiz, status, _ = finais[vencedor]
+    avaliacoes = tuple(sum(contagem[i] for contagem in contagens.values()) for i in (0, 1))
+    hist = historicos[vencedor]
+    return vencedor, Resultado(raiz, hist.n, avaliacoes, tempo, status, hist.valores())
@@ -0,0 +1,135 @@
+import contextlib
+import decimal
+import math
+from fractions import Fraction
+
+import numpy as np
+
+# ==========================================================
+# PRECISÃO NUMÉRICA
+# ==========================================================
+# O tipo é resolvido uma única vez por chamada em um objeto Precisao; dentro
+# do laço os métodos só chamam p.converter sobre cada novo iterado, sem
+# testar o tipo a cada iteração.
+#
+# Tipos aceitos:
+#   "float64", "float32", "float16", "longdouble"
+#   "fraction" / "fraction:d" → frações (fractions.Fraction) com denominador
+#                           de no máximo 10^d (padrão 30): acima disso o valor
+#                           vira a fração mais próxima com esse limite
+#                           (Fraction.limit_denominator). Sem limite, com f
+#                           polinomial os denominadores crescem sem parar
+#                           (em Illinois ou no ponto fixo, a cada passo) e
+#                           cada iteração fica mais lenta que a anterior
+#   "decimal" / "decimal:d" → decimal.Decimal com d dígitos (padrão 28): os
+#                           iterados são arredondados a d dígitos e as contas
+#                           rodam num contexto decimal com prec=d (ver ativar)
+#   "trunc" / "trunc:k"   → truncamento em k casas decimais (padrão 4)
+#   "arred:k"             → arredondamento em k casas decimais
+# Os tipos de ponto flutuante do NumPy também podem ser usados nos métodos
+# em lote (ver lote.py).
+#
+# Quem conduz os geradores (metodos._resolver, portfolio.py) roda cada passo
+# dentro de p.ativar(): com decimal:d, o contexto decimal com prec=d; sem
+# isso as operações com Decimal usariam o contexto corrente (28 dígitos por
+# padrão) e decimal:50 pararia em 28. O contexto decimal é por thread, então
+# cada thread entra no seu.
+
+class Precisao:
+    __slots__ = ("nome", "converter", "eps", "dtype", "exato", "contexto")
+
+    def __init__(self, nome, converter, eps, dtype, exato=False, contexto=None):
+        self.nome = nome
+        self.converter = converter
+        self.eps = eps
+        self.dtype = dtype
+        # Fraction e Decimal não se misturam com float: os valores de f
+        # também passam por converter
+        self.exato = exato
+        self.contexto = contexto
+
+    def ativar(self):
+        if self.contexto is None:
+            return contextlib.nullcontext()
+        return decimal.localcontext(self.contexto)
+
+    def funcao(self, f):
+        if not self.exato:
+            return f
+        converter = self.converter
+        return lambda x: converter(f(x))
+
+    def __repr__(self):
+        return f"Precisao({self.nome!r})"
+
+
+def _identidade(x):
+    return x
+
+
+# trunc/arred passam por um inteiro do Python (math.trunc/math.floor), sem
+# a maquinaria de escalares do NumPy; para arrays, ver truncado.py
+def truncar(k):
+    escala = 10 ** k
+    return lambda x: math.trunc(x * escala) / escala
+
+
+def arredondar(k):
+    escala = 10 ** k
+    return lambda x: math.copysign(math.floor(abs(x) * escala + 0.5), x) / escala
+
+
+def _ponto_flutuante(nome, dtype):
+    converter = _identidade if dtype is np.float64 else dtype
+    return Precisao(nome, converter, np.finfo(dtype).eps, dtype)
+
+
+def _decimal(digitos):
+    contexto = decimal.Context(prec=digitos)
+    eps = decimal.Decimal(10) ** (1 - digitos)
+    return Precisao(f"decimal:{digitos}", contexto.create_decimal, eps, object, exato=True, contexto=contexto)
+
+
+def _fracao(digitos):
+    limite = 10 ** digitos
+
+    def converter(x):
+        if not isinstance(x, Fraction):
+            x = Fraction(x)
+        return x.limit_denominator(limite) if x.denominator > limite else x
+    return Precisao(f"fraction:{digitos}", converter, 0, object, exato=True)
+
+
+_FLUTUANTES = {
+    "float64": np.float64,
+    "float32": np.float32,
+    "float16": np.float16,
+    "longdouble": np.longdouble,
+}
+
+
+def precisao(tipo="float64"):
+    if isinstance(tipo, Precisao):
+        return tipo
+
+    nome, _, parametro = tipo.partition(":")
+    if nome in _FLUTUANTES and not parametro:
+        return _ponto_flutuante(nome, _FLUTUANTES[nome])
+    if nome == "fraction":
+        return _fracao(int(parametro) if parametro else 30)
+    if nome == "decimal":
+        return _decimal(int(parametro) if parametro else 28)
+    if nome == "trunc":
+        k = int(parametro) if parametro else 4
+        return Precisao(f"trunc:{k}", truncar(k), np.finfo(np.float64).eps, np.float64)
+    if nome == "arred" and parametro:
+        k = int(parametro)
+        return Precisao(f"arred:{k}", arredondar(k), np.finfo(np.float64).eps, np.float64)
+    raise ValueError(f"tipo desconhecido: {tipo!r}")
+
+
+def dtype_lote(tipo="float64"):
+    p = precisao(tipo)
+    if p.nome not in _FLUTUANTES:
+        raise ValueError(f"os métodos em lote só aceitam {', '.join(_FLUTUANTES)}, não {tipo!r}")
+    return np.dtype(p.dtype)
@@ -0,0 +1,60 @@
+# ==========================================================
+# RESULTADO DE UM MÉTODO
+# ==========================================================
+
+# Status de um problema (também usados pelos métodos em lote)
+CONVERGIU = 0
+MAX_ITER = 1
+FALHOU = 2    # denominador/derivada nula, NaN, infinito ou intervalo sem troca de sinal
+ESTAGNOU = 3  # iterado parado ou intervalo de uma ULP: limite da precisão
+DIVERGIU = 4  # passos que não diminuem (ou |g'(x0)| > 1 e o primeiro passo cresce)
+CICLO = 5     # iterado repetido: ciclo entre iterados
+
+NOMES_STATUS = {
+    CONVERGIU: "convergiu",
+    MAX_ITER: "máximo de iterações",
+    FALHOU: "falhou",
+    ESTAGNOU: "estagnou (limite da precisão)",
+    DIVERGIU: "divergiu (passos não diminuem)",
+    CICLO: "ciclo entre iterados",
+}
+
+
+# Nos métodos em lote (lote.py, truncado.py), cada iteração grava o status
+# dos problemas que pararam e os retira do lote. idx são as posições dos
+# problemas ativos no lote original. Estagnação (ver tolerancia.py) e
+# divergência (ver divergencia.py) só contam para quem não convergiu nem
+# falhou, e divergência só para quem também não estagnou.
+
+def marcar_parados(status, idx, conv, falha, estagnou, diverge=None):
+    # devolve a máscara dos problemas que continuam
+    parados = conv | falha
+    estagnou = estagnou & ~parados
+    parados = parados | estagnou
+    status[idx[conv]] = CONVERGIU
+    status[idx[falha]] = FALHOU
+    status[idx[estagnou]] = ESTAGNOU
+    if diverge is not None:
+        diverge = diverge & ~parados
+        parados = parados | diverge
+        status[idx[diverge]] = DIVERGIU
+    return ~parados
+
+
+class Resultado:
+    # Registro compacto devolvido por todos os métodos escalares.
+    # avaliacoes é o par (avaliações de f, avaliações de df).
+    __slots__ = ("raiz", "iteracoes", "avaliacoes", "tempo", "status", "historico")
+
+    def __init__(self, raiz, iteracoes, avaliacoes, tempo, status, historico):
+        self.raiz = raiz
+        self.iteracoes = iteracoes
+        self.avaliacoes = avaliacoes
+        self.tempo = tempo
+        self.status = status
+        self.historico = historico
+
+    def __repr__(self):
+        return (f"Resultado(raiz={self.raiz!r}, iteracoes={self.iteracoes}, "
+                f"avaliacoes={self.avaliacoes}, tempo={self.tempo:.3e}, "
+                f"status={NOMES_STATUS[self.status]!r})")
@@ -0,0 +1,67 @@
+from .resultado import CONVERGIU, ESTAGNOU
+
+# ==========================================================
+# CRITÉRIOS DE PARADA
+# ==========================================================
+# tol pode ser um número (|f(x)| < tol, como sempre; no ponto fixo,
+# |x_novo - x| < tol) ou uma Tolerancia com critérios combinados:
+#   residuo, residuo_relativo → para quando |f(x)| < residuo + residuo_relativo·|f(x0)|
+#   passo, passo_relativo     → para quando |Δx| < passo + passo_relativo·|x|
+# Basta um dos dois critérios ser atendido; os de passo valem 0 por padrão
+# (desligados). Como a precisão, é resolvida uma única vez por chamada.
+#
+# Independente de tol, o método para com status ESTAGNOU quando o iterado
+# deixa de mudar (|Δx| <= eps·|x|, ou seja, abaixo da resolução do tipo:
+# o resíduo chegou ao piso da precisão) ou quando o intervalo dos métodos
+# intervalares não tem mais nenhum ponto representável entre os extremos.
+# Com "trunc" ou "float32" e tol = 1e-6, isso evita gastar todas as
+# max_iter iterações com o mesmo iterado.
+
+class Tolerancia:
+    __slots__ = ("residuo", "residuo_relativo", "passo", "passo_relativo")
+
+    def __init__(self, residuo=1e-6, residuo_relativo=0.0, passo=0.0, passo_relativo=0.0):
+        self.residuo = residuo
+        self.residuo_relativo = residuo_relativo
+        self.passo = passo
+        self.passo_relativo = passo_relativo
+
+    def limite_residuo(self, f_inicial):
+        if not self.residuo_relativo:
+            return self.residuo
+        return self.residuo + self.residuo_relativo * abs(float(f_inicial))
+
+    def __repr__(self):
+        return (f"Tolerancia(residuo={self.residuo!r}, residuo_relativo={self.residuo_relativo!r}, "
+                f"passo={self.passo!r}, passo_relativo={self.passo_relativo!r})")
+
+
+def tolerancia(tol=1e-6):
+    if isinstance(tol, Tolerancia):
+        return tol
+    return Tolerancia(residuo=tol)
+
+
+def teste_passo(t, p):
+    # devolve parar(passo, x): CONVERGIU se o passo atende à tolerância,
+    # ESTAGNOU se ficou abaixo da resolução do tipo, senão None
+    tol_x, tol_r, eps = t.passo, t.passo_relativo, p.eps
+    if p.exato:
+        # Decimal não se mistura com float
+        tol_x, tol_r = p.converter(tol_x), p.converter(tol_r)
+
+    if not (tol_x or tol_r):
+        def parar(passo, x):
+            if abs(passo) <= eps * abs(x):
+                return ESTAGNOU
+            return None
+        return parar
+
+    def parar(passo, x):
+        passo, x = abs(passo), abs(x)
+        if passo < tol_x + tol_r * x:
+            return CONVERGIU
+        if passo <= eps * x:
+            return ESTAGNOU
+        return None
+    return parar
@@ -0,0 +1,221 @@
+import numpy as np
+
+from .resultado import MAX_ITER, marcar_parados
+
+# ==========================================================
+# ARITMÉTICA TRUNCADA EM PONTO FIXO (INTEIROS ESCALADOS)
+# ==========================================================
+# Um número com k casas decimais é guardado como o inteiro n = x * 10^k
+# (int64), então os iterados têm exatamente a semântica decimal do
+# experimento de truncamento: 0.7390 é 7390, não o binário mais próximo.
+# modo="trunc" trunca em direção a zero; modo="arred" arredonda a metade
+# para longe do zero. Com int64 e k = 4 os valores precisam caber em
+# ±9.2e14; produtos em multiplicar, em ±9.2e18 antes do reescalonamento.
+# Um iterado fora dessa faixa (Newton em atan a partir de 2, por exemplo)
+# para o problema com FALHOU, em vez de dar a volta no int64.
+#
+# Os métodos em lote recebem arrays de intervalos ou chutes como lote.py,
+# avaliam f (em float64) no valor decimal exato de cada iterado e
+# devolvem (raizes, iteracoes, status).
+# Como nos métodos escalares (ver tolerancia.py), um problema para com
+# ESTAGNOU quando chega ao piso da precisão sem atingir tol: o novo iterado
+# é igual ao anterior (passo menor que 10^-k) ou, na bissecção e na falsa
+# posição, coincide com um dos extremos (nenhum número de k casas entre eles).
+
+def _dividir(n, d, modo):
+    # divisão inteira n / d com truncamento ou arredondamento
+    sinal = np.where(np.logical_xor(n < 0, d < 0), -1, 1)
+    n, d = np.abs(n), np.abs(d)
+    if modo == "trunc":
+        return sinal * (n // d)
+    if modo == "arred":
+        return sinal * ((2 * n + d) // (2 * d))
+    raise ValueError(f"modo desconhecido: {modo!r}")
+
+
+def _quantizar_escalado(escalado, modo):
+    if modo == "trunc":
+        return np.trunc(escalado).astype(np.int64)
+    if modo == "arred":
+        return (np.sign(escalado) * np.floor(np.abs(escalado) + 0.5)).astype(np.int64)
+    raise ValueError(f"modo desconhecido: {modo!r}")
+
+
+def quantizar(x, digitos=4, modo="trunc"):
+    return _quantizar_escalado(np.asarray(x, dtype=np.float64) * 10.0 ** digitos, modo)
+
+
+def _deslocar(n, passo, digitos, modo):
+    # quantiza o novo iterado n + passo (e não só o passo), com n já escalado;
+    # n é exato em float64 até 2^53. Devolve também a máscara dos iterados
+    # que não cabem em int64, que ficam no valor anterior
+    escalado = n + passo * 10.0 ** digitos
+    fora = ~(np.abs(escalado) < 2.0 ** 63)
+    return np.where(fora, n, _quantizar_escalado(np.where(fora, 0, escalado), modo)), fora
+
+
+def valor(n, digitos=4):
+    return np.asarray(n, dtype=np.int64) / 10.0 ** digitos
+
+
+def multiplicar(a, b, digitos=4, modo="trunc"):
+    return _dividir(np.asarray(a, dtype=np.int64) * b, np.int64(10 ** digitos), modo)
+
+
+def dividir(a, b, digitos=4, modo="trunc"):
+    return _dividir(np.asarray(a, dtype=np.int64) * 10 ** digitos, np.asarray(b, dtype=np.int64), modo)
+
+
+def _preparar(digitos, modo, valores, args):
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in (*valores, *args)])
+    formato = arrays[0].shape
+    n = len(valores)
+    return (formato, [quantizar(a.ravel(), digitos, modo) for a in arrays[:n]],
+            [a.ravel().copy() for a in arrays[n:]])
+
+
+def _saidas(n):
+    return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64), np.full(n, MAX_ITER, dtype=np.int8)
+
+
+def _finalizar(formato, raizes, iteracoes, status, digitos):
+    return valor(raizes, digitos).reshape(formato), iteracoes.reshape(formato), status.reshape(formato)
+
+
+# ==========================================================
+# BISSECÇÃO
+# ==========================================================
+# O ponto médio (a + b) / 2 é calculado só com inteiros.
+
+def bisseccao(f, inicio, fim, digitos=4, modo="trunc", tol=1e-6, max_iter=100, args=()):
+    formato, (a, b), p = _preparar(digitos, modo, (inicio, fim), args)
+    raizes, iteracoes, status = _saidas(a.size)
+    idx = np.arange(a.size)
+
+    with np.errstate(all="ignore"):
+        fa = f(valor(a, digitos), *p)
+        for i in range(max_iter):
+            m = _dividir(a + b, np.int64(2), modo)
+            fm = f(valor(m, digitos), *p)
+            raizes[idx] = m
+            iteracoes[idx] = i + 1
+
+            conv = np.abs(fm) < tol
+            falha = ~np.isfinite(fm)
+            ativos = marcar_parados(status, idx, conv, falha, (m == a) | (m == b))
+
+            esquerda = fa * fm < 0
+            b = np.where(esquerda, m, b)
+            a = np.where(esquerda, a, m)
+            fa = np.where(esquerda, fa, fm)
+
+            idx, a, b, fa = idx[ativos], a[ativos], b[ativos], fa[ativos]
+            p = [v[ativos] for v in p]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status, digitos)
+
+
+# ==========================================================
+# FALSA POSIÇÃO
+# ==========================================================
+
+def falsa_posicao(f, inicio, fim, digitos=4, modo="trunc", tol=1e-6, max_iter=100, args=()):
+    formato, (a, b), p = _preparar(digitos, modo, (inicio, fim), args)
+    raizes, iteracoes, status = _saidas(a.size)
+    idx = np.arange(a.size)
+
+    with np.errstate(all="ignore"):
+        fa, fb = f(valor(a, digitos), *p), f(valor(b, digitos), *p)
+        for i in range(max_iter):
+            # ponto falso escrito como deslocamento a partir de a:
+            # m = a + (b - a) * fa / (fa - fb)
+            passo = valor(b - a, digitos) * (fa / (fa - fb))
+            falha = ~np.isfinite(passo)
+            m, fora = _deslocar(a, np.where(falha, 0, passo), digitos, modo)
+            falha |= fora
+            fm = f(valor(m, digitos), *p)
+            raizes[idx] = m
+            iteracoes[idx] = i + 1
+
+            conv = (np.abs(fm) < tol) & ~falha
+            falha |= ~np.isfinite(fm)
+            ativos = marcar_parados(status, idx, conv, falha, (m == a) | (m == b))
+
+            esquerda = fa * fm < 0
+            b, fb = np.where(esquerda, m, b), np.where(esquerda, fm, fb)
+            a, fa = np.where(esquerda, a, m), np.where(esquerda, fa, fm)
+
+            idx, a, b, fa, fb = idx[ativos], a[ativos], b[ativos], fa[ativos], fb[ativos]
+            p = [v[ativos] for v in p]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status, digitos)
+
+
+# ==========================================================
+# NEWTON
+# ==========================================================
+
+def newton(f, df, chute, digitos=4, modo="trunc", tol=1e-6, max_iter=100, args=()):
+    formato, (x,), p = _preparar(digitos, modo, (chute,), args)
+    raizes, iteracoes, status = _saidas(x.size)
+    idx = np.arange(x.size)
+
+    with np.errstate(all="ignore"):
+        fx = f(valor(x, digitos), *p)
+        for i in range(max_iter):
+            passo = fx / df(valor(x, digitos), *p)
+            falha = ~np.isfinite(passo)
+            proximo, fora = _deslocar(x, -np.where(falha, 0, passo), digitos, modo)
+            falha |= fora
+            fp = f(valor(proximo, digitos), *p)
+            raizes[idx] = proximo
+            iteracoes[idx] = i + 1
+
+            conv = (np.abs(fp) < tol) & ~falha
+            falha |= ~np.isfinite(fp)
+            ativos = marcar_parados(status, idx, conv, falha, proximo == x)
+
+            idx, x, fx = idx[ativos], proximo[ativos], fp[ativos]
+            p = [v[ativos] for v in p]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status, digitos)
+
+
+# ==========================================================
+# SECANTE
+# ==========================================================
+
+def secante(f, chute1, chute2, digitos=4, modo="trunc", tol=1e-6, max_iter=100, args=()):
+    formato, (x0, x1), p = _preparar(digitos, modo, (chute1, chute2), args)
+    raizes, iteracoes, status = _saidas(x0.size)
+    idx = np.arange(x0.size)
+
+    with np.errstate(all="ignore"):
+        f0, f1 = f(valor(x0, digitos), *p), f(valor(x1, digitos), *p)
+        for i in range(max_iter):
+            passo = f1 * valor(x1 - x0, digitos) / (f1 - f0)
+            falha = ~np.isfinite(passo)
+            x2, fora = _deslocar(x1, -np.where(falha, 0, passo), digitos, modo)
+            falha |= fora
+            f2 = f(valor(x2, digitos), *p)
+            raizes[idx] = x2
+            iteracoes[idx] = i + 1
+
+            conv = (np.abs(f2) < tol) & ~falha
+            falha |= ~np.isfinite(f2)
+            ativos = marcar_parados(status, idx, conv, falha, x2 == x1)
+
+            idx = idx[ativos]
+            p = [v[ativos] for v in p]
+            x0, f0 = x1[ativos], f1[ativos]
+            x1, f1 = x2[ativos], f2[ativos]
+            if idx.size == 0:
+                break
+
+    return _finalizar(formato, raizes, iteracoes, status, digitos)
@@ -0,0 +1,301 @@
+import decimal
+import math
+import sys
+import tempfile
+
+import numpy as np
+
+from raizes import (bisseccao, falsa_posicao, illinois, newton, secante, ponto_fixo, brent, newton_bisseccao,
+                    halley, portfolio, encontrar_raizes, Polinomio, raizes_polinomios, valor_e_derivada, derivadas,
+                    CONVERGIU, FALHOU, ESTAGNOU, DIVERGIU, CICLO, NOMES_STATUS)
+from raizes import lote, truncado, compensado, pontoflutuante, cache, armazenamento
+
+# ==========================================================
+# CASOS DE REGRESSÃO
+# ==========================================================
+# Casos conferidos a cada mudança nos métodos: raiz esperada, status aceitos
+# e um teto de iterações (o que pegaria um método que deixou de convergir ou
+# passou a gastar todas as max_iter). Os métodos em lote (lote.py e
+# truncado.py) são conferidos do mesmo jeito, problema a problema; os demais
+# módulos, pelo valor devolvido. Roda com
+#
+#   python regressao.py
+#
+# e termina com código 1 se algum caso falhar.
+
+def f1(x):
+    return x**3 - 7*x + 6
+
+def df1(x):
+    return 3*x**2 - 7
+
+def g1(x):
+    return (x**3 + 6) / 7
+
+def datan(x):
+    return 1 / (1 + x**2)
+
+# Newton em x³ - 2x + 2 a partir de 0: ciclo 0 → 1 → 0
+def f_ciclo(x):
+    return x**3 - 2*x + 2
+
+def df_ciclo(x):
+    return 3*x**2 - 2
+
+# cos x - x, em arrays, para os métodos em lote
+def f_cos(x):
+    return np.cos(x) - x
+
+def df_cos(x):
+    return -np.sin(x) - 1
+
+P1 = Polinomio([1, 0, -7, 6])
+
+# (nome, chamada, raiz esperada, erro aceito, status aceitos, teto de iterações)
+CASOS = []
+for tipo, erro in [("float64", 1e-6), ("float32", 1e-6), ("trunc", 1e-3), ("decimal:30", 1e-6), ("fraction", 1e-6)]:
+    CASOS += [
+        (f"Bissecção F1 [0.5, 1.5] {tipo}", lambda tipo=tipo: bisseccao(f1, 0.5, 1.5, tipo=tipo), 1, erro, (CONVERGIU,), 25),
+        (f"Falsa Posição F1 [0.5, 1.5] {tipo}", lambda tipo=tipo: falsa_posicao(f1, 0.5, 1.5, tipo=tipo), 1, erro, (CONVERGIU,), 25),
+        (f"Illinois F1 [0.5, 1.5] {tipo}", lambda tipo=tipo: illinois(f1, 0.5, 1.5, tipo=tipo), 1, erro, (CONVERGIU,), 25),
+        (f"Newton F1 x0=3 {tipo}", lambda tipo=tipo: newton(f1, df1, 3, tipo=tipo), 2, erro, (CONVERGIU,), 10),
+        (f"Secante F1 [0.5, 1.5] {tipo}", lambda tipo=tipo: secante(f1, 0.5, 1.5, tipo=tipo), 1, erro, (CONVERGIU,), 10),
+        (f"Ponto Fixo F1 x0=0.5 {tipo}", lambda tipo=tipo: ponto_fixo(g1, 0.5, tipo=tipo), 1, erro, (CONVERGIU,), 25),
+        (f"Brent F1 [0.5, 1.5] {tipo}", lambda tipo=tipo: brent(f1, 0.5, 1.5, tipo=tipo), 1, erro, (CONVERGIU,), 10),
+        (f"Newton-Bissecção F1 [1.5, 2.5] {tipo}", lambda tipo=tipo: newton_bisseccao(f1, df1, 1.5, 2.5, tipo=tipo), 2, erro, (CONVERGIU,), 10),
+        (f"Newton-Bissecção F1 [-4, 0] {tipo}", lambda tipo=tipo: newton_bisseccao(f1, df1, -4, 0, tipo=tipo), -3, erro, (CONVERGIU,), 5),
+    ]
+
+CASOS += [
+    # a salvaguarda não pode se fechar sobre -2 (f(-2) = 20) nem travar em atan
+    ("Newton-Bissecção atan [-10, 3]", lambda: newton_bisseccao(math.atan, datan, -10, 3), 0, 1e-6, (CONVERGIU,), 10),
+    ("Newton-Bissecção F1 [1.7, 2.9]", lambda: newton_bisseccao(f1, df1, 1.7, 2.9), 2, 1e-6, (CONVERGIU,), 10),
+    # intervalo sem troca de sinal: FALHOU sem iterar
+    ("Brent F1 [3, 4]", lambda: brent(f1, 3, 4), None, None, (FALHOU,), 0),
+    ("Newton-Bissecção F1 [3, 4]", lambda: newton_bisseccao(f1, df1, 3, 4), None, None, (FALHOU,), 0),
+    # raiz num dos extremos: devolvida sem iterar
+    ("Newton-Bissecção x - 2 [2, 5]", lambda: newton_bisseccao(lambda x: x - 2, None, 2, 5), 2, 0, (CONVERGIU,), 0),
+    ("Newton-Bissecção F1 [-3, 0]", lambda: newton_bisseccao(f1, df1, -3, 0), -3, 0, (CONVERGIU,), 0),
+    # o intervalo do Brent só para em |f| < tol (ou no piso da precisão, com ESTAGNOU)
+    ("Brent 1e6·(x³ - 2) [0, 3]", lambda: brent(lambda x: 1e6 * (x**3 - 2), 0, 3), 2 ** (1 / 3), 1e-9, (CONVERGIU,), 15),
+    ("Brent 1e12·(x² - 2) [0, 4]", lambda: brent(lambda x: 1e12 * (x**2 - 2), 0, 4), math.sqrt(2), 1e-9, (ESTAGNOU,), 15),
+    # no piso da precisão: para com ESTAGNOU em vez de gastar max_iter
+    ("Bissecção F1 tol=1e-12 float32", lambda: bisseccao(f1, 0.5, 1.5, tol=1e-12, tipo="float32"), 1, 1e-6, (CONVERGIU, ESTAGNOU), 30),
+    ("Newton F1 tol=1e-12 trunc", lambda: newton(f1, df1, 3, tol=1e-12, tipo="trunc"), 2, 1e-3, (CONVERGIU, ESTAGNOU), 15),
+    ("Ponto Fixo F1 tol=1e-12 trunc", lambda: ponto_fixo(g1, 0.5, tol=1e-12, tipo="trunc"), 1, 1e-3, (CONVERGIU, ESTAGNOU), 20),
+    # frações com denominador limitado: sem o limite, Illinois e o ponto fixo não terminam
+    ("Illinois F1 tol=1e-20 fraction", lambda: illinois(f1, 0.5, 1.5, tol=1e-20, tipo="fraction"), 1, 1e-15, (CONVERGIU, ESTAGNOU), 100),
+    ("Ponto Fixo F1 tol=1e-20 fraction", lambda: ponto_fixo(g1, 0.5, tol=1e-20, tipo="fraction"), 1, 1e-15, (CONVERGIU, ESTAGNOU), 100),
+    # sem contração: para cedo com DIVERGIU, CICLO ou FALHOU
+    ("Newton ciclo x³ - 2x + 2", lambda: newton(f_ciclo, df_ciclo, 0), None, None, (CICLO,), 5),
+    ("Newton atan x0=2", lambda: newton(math.atan, datan, 2), None, None, (DIVERGIU, FALHOU), 10),
+    ("Newton x² + 1", lambda: newton(lambda x: x**2 + 1, lambda x: 2*x, 0.5), None, None, (DIVERGIU, CICLO), 40),
+    ("Ponto Fixo exp", lambda: ponto_fixo(math.exp, 0.0), None, None, (DIVERGIU, FALHOU), 10),
+    ("Secante x² + 1", lambda: secante(lambda x: x**2 + 1, 0.5, 1.5), None, None, (DIVERGIU, CICLO), 40),
+    # chutes distantes: a secante vagueia antes de convergir, sem DIVERGIU
+    ("Secante F1 [-1.1449, -6.9820]", lambda: secante(f1, -1.1449, -6.9820), -3, 1e-6, (CONVERGIU,), 40),
+    # pré-voo sem derivada em x0: não pode derrubar o método
+    ("Ponto Fixo √x x0=0", lambda: ponto_fixo(lambda x: x**0.5, 0.0), 0, 1e-6, (CONVERGIU,), 5),
+    ("Ponto Fixo √x x0=0.5", lambda: ponto_fixo(lambda x: x**0.5, 0.5), 1, 1e-5, (CONVERGIU,), 30),
+    # derivadas automáticas (dual.py) e Horner (polinomio.py)
+    ("Newton F1 x0=3 sem df", lambda: newton(f1, chute=3), 2, 1e-6, (CONVERGIU,), 10),
+    ("Halley F1 x0=3 sem derivadas", lambda: halley(f1, chute=3), 2, 1e-6, (CONVERGIU,), 6),
+    ("Newton Polinomio F1 x0=3", lambda: newton(P1.f, P1.df, 3), 2, 1e-6, (CONVERGIU,), 10),
+    # portfólio: Newton também corre sem df; com f do módulo math ele sai da corrida
+    ("Portfólio F1 [1.5, 2.5] sem df", lambda: portfolio(f1, None, 1.5, 2.5)[1], 2, 1e-6, (CONVERGIU,), 10),
+    ("Portfólio cos x - x (math)", lambda: portfolio(lambda x: math.cos(x) - x, None, 0, 1)[1], 0.7390851332, 1e-6,
+     (CONVERGIU,), 10),
+]
+
+
+# métodos em lote: (nome, chamada, raiz esperada, erro aceito, status aceitos, teto de iterações);
+# a chamada devolve (raizes, iteracoes, status) e cada problema é conferido
+CASOS_LOTE = [
+    ("lote Bissecção F1", lambda: lote.bisseccao(f1, [0.5, -4, 1.5], [1.5, 0, 2.5]), [1, -3, 2], 1e-6, (CONVERGIU,), 25),
+    ("lote Falsa Posição F1", lambda: lote.falsa_posicao(f1, [0.5, 1.5], [1.5, 2.5]), [1, 2], 1e-6, (CONVERGIU,), 25),
+    ("lote Illinois F1", lambda: lote.illinois(f1, [0.5, 1.5], [1.5, 2.5]), [1, 2], 1e-6, (CONVERGIU,), 25),
+    ("lote Newton F1", lambda: lote.newton(f1, df1, [3, -4]), [2, -3], 1e-6, (CONVERGIU,), 10),
+    ("lote Newton F1 sem df", lambda: lote.newton(f1, chute=[3, -4]), [2, -3], 1e-6, (CONVERGIU,), 10),
+    ("lote Secante F1", lambda: lote.secante(f1, [0.5, 1.5], [1.5, 2.5]), [1, 2], 1e-6, (CONVERGIU,), 10),
+    ("lote Secante F1 chutes distantes", lambda: lote.secante(f1, [-1.1449], [-6.9820]), [-3], 1e-6, (CONVERGIU,), 40),
+    ("lote Ponto Fixo F1", lambda: lote.ponto_fixo(g1, [0.5, 0.2]), [1, 1], 1e-5, (CONVERGIU,), 30),
+    # no piso da precisão: ESTAGNOU, não DIVERGIU nem max_iter
+    ("lote Ponto Fixo cos float16", lambda: lote.ponto_fixo(np.cos, [0.5], tipo="float16"), [0.739085], 1e-3,
+     (CONVERGIU, ESTAGNOU), 25),
+    ("lote Bissecção cos x - x float16", lambda: lote.bisseccao(f_cos, [0, 0.2], [1, 1], tol=1e-9, tipo="float16"),
+     [0.739085] * 2, 1e-3, (ESTAGNOU,), 15),
+    ("lote Illinois cos x - x float16", lambda: lote.illinois(f_cos, [0, 0.2], [1, 1], tol=1e-9, tipo="float16"),
+     [0.739085] * 2, 1e-3, (ESTAGNOU,), 15),
+    ("lote Secante cos x - x float16", lambda: lote.secante(f_cos, [0, 0.5], [1, 1], tol=1e-9, tipo="float16"),
+     [0.739085] * 2, 1e-3, (ESTAGNOU,), 10),
+    # truncamento em 4 casas com inteiros (truncado.py)
+    ("truncado Bissecção cos x - x", lambda: truncado.bisseccao(f_cos, [0, 0.2], [1, 1]), [0.739] * 2, 1e-3,
+     (ESTAGNOU,), 20),
+    ("truncado Falsa Posição cos x - x", lambda: truncado.falsa_posicao(f_cos, [0, 0.2], [1, 1]), [0.739] * 2, 1e-3,
+     (ESTAGNOU,), 20),
+    ("truncado Newton cos x - x", lambda: truncado.newton(f_cos, df_cos, [0.5, 1]), [0.739] * 2, 1e-3, (ESTAGNOU,), 10),
+    ("truncado Secante cos x - x", lambda: truncado.secante(f_cos, [0, 0.5], [1, 1]), [0.739] * 2, 1e-3,
+     (ESTAGNOU,), 10),
+    ("truncado Newton F1 arred", lambda: truncado.newton(f1, df1, [3, -4], modo="arred"), [2, -3], 1e-4,
+     (CONVERGIU,), 10),
+    # iterado fora da faixa do int64: FALHOU, não um valor que deu a volta
+    ("truncado Newton atan x0=2", lambda: truncado.newton(np.arctan, datan, [2.0]), None, None, (FALHOU,), 10),
+]
+
+
+# busca de todas as raízes: (nome, f, a, b, raízes esperadas, pontos da malha)
+CASOS_BUSCA = [
+    ("x³ - 7x + 6", f1, -4, 4, [-3, 1, 2], 1000),
+    ("(x - 1)²", lambda x: (x - 1)**2, -3, 3, [1], 1000),
+    # malha simétrica em torno da raiz dupla: dois vizinhos com o mesmo |f|
+    ("(x - 1)² 11 pontos", lambda x: (x - 1)**2, 0, 2, [1], 11),
+    ("(x - 1)² 101 pontos", lambda x: (x - 1)**2, 0, 2, [1], 101),
+    # escala grande: |f| < tol é inatingível, a troca de sinal basta
+    ("1e12·(x² - 2)", lambda x: 1e12 * (x**2 - 2), -4, 4, [-math.sqrt(2), math.sqrt(2)], 1000),
+    ("1e6·(eˣ - 3)", lambda x: 1e6 * (np.exp(x) - 3), -4, 4, [math.log(3)], 1000),
+    ("1e9·sen x", lambda x: 1e9 * np.sin(x), -10, 10, [k * math.pi for k in range(-3, 4)], 1000),
+    # polos trocam de sinal sem ser raízes
+    ("tan x", np.tan, -4, 4, [-math.pi, 0, math.pi], 1000),
+    ("1/x", lambda x: 1 / x, -1, 1.3, [], 1000),
+]
+
+
+def cache_em_disco():
+    # a mesma chamada duas vezes: a segunda vem do disco; um valor que o
+    # pickle não grava volta mesmo assim
+    c = cache.Cache(tempfile.mkdtemp())
+    primeira = c.chamar(bisseccao, f1, 0.5, 1.5)
+    tamanho = c.tamanho()
+    segunda = c.chamar(bisseccao, f1, 0.5, 1.5)
+    valor, _ = c.chamar(lambda: (1.0, lambda x: x))
+    return [primeira.raiz, segunda.raiz, tamanho > 0, c.tamanho() == tamanho, valor]
+
+
+def armazenamento_em_disco():
+    # dois blocos gravados em fluxo e lidos de volta por mmap
+    pasta = tempfile.mkdtemp()
+    with armazenamento.Gravador(pasta, metadados={"n": 5}) as gravador:
+        gravador.anexar(raizes=np.array([1.0, 2.0]), status=np.array([0, 0], dtype=np.int8))
+        gravador.anexar(raizes=np.array([3.0, 4.0, 5.0]), status=np.array([0, 3, 4], dtype=np.int8))
+    dados = armazenamento.Resultados(pasta)
+    return [*dados["raizes"], *dados["status"], len(dados), dados.metadados["n"]]
+
+
+def historicos_em_disco():
+    # coluna irregular: um histórico de tamanho diferente por problema,
+    # inclusive vazio, em dois blocos
+    pasta = tempfile.mkdtemp()
+    with armazenamento.Gravador(pasta, irregulares=("historico",)) as gravador:
+        gravador.anexar(raizes=np.array([1.0, 2.0]), historico=[np.array([0.5, 0.9, 1.0]), np.array([])])
+        gravador.anexar(raizes=np.array([3.0]), historico=[np.array([2.5, 3.0])])
+    dados = armazenamento.Resultados(pasta)
+    return [len(dados), *dados.historico(0), dados.historico(1).size, *dados.historico(2), len(dados.colunas)]
+
+
+# demais módulos: (nome, chamada, valor esperado, erro aceito)
+def newton_sem_dual():
+    # f com o módulo math e sem df: um TypeError que pede df, não o do math
+    try:
+        newton(lambda x: math.exp(x) - 2, None, 1)
+    except TypeError as erro:
+        return ["passe df" in str(erro)]
+    return [False]
+
+
+def raiz_decimal_50():
+    # decimal:50 calcula com 50 dígitos, não com os 28 do contexto padrão:
+    # status e erro em relação a √2 com 60 dígitos
+    r = newton(lambda x: x * x - 2, lambda x: 2 * x, 1, tol=1e-45, tipo="decimal:50")
+    return [r.status, abs(r.raiz - decimal.Context(prec=60).sqrt(2))]
+
+
+CASOS_VALORES = [
+    ("dual: sen e cos em 0.5", lambda: valor_e_derivada(np.sin, 0.5), [math.sin(0.5), math.cos(0.5)], 1e-15),
+    ("dual: derivadas de F1 em 2", lambda: derivadas(f1, 2.0, 3), [0, 5, 12, 6], 1e-12),
+    ("Polinomio F1 raízes reais", lambda: P1.raizes_reais(), [-3, 1, 2], 1e-10),
+    ("Polinomio F1 f e df em 3", lambda: (P1.f(3.0), P1.df(3.0)), [12, 20], 0),
+    ("raizes_polinomios x² - 3x + 2, x² - 1",
+     lambda: np.sort(raizes_polinomios(np.array([[1.0, -3, 2], [1, 0, -1]])).real, axis=1), [[1, 2], [-1, 1]], 1e-12),
+    # Horner compensado perto da raiz sétupla: erro na casa de 1e-30, o comum na de 1e-15
+    ("compensado (x - 1)⁷ expandida",
+     lambda: compensado.estudo_cancelamento()["erro_compensada"], 0, 1e-25),
+    ("pontoflutuante eps float32", lambda: pontoflutuante.parametros("float32")["eps"], 2.0 ** -23, 0),
+    ("pontoflutuante ((1+x)-1)/x em 1e-15", lambda: pontoflutuante.erros("((1+x)-1)/x", "float64", [1e-15])[2],
+     [0.1102230246251565], 1e-12),
+    ("Newton √2 decimal:50 tol=1e-45", raiz_decimal_50, [CONVERGIU, 0], 1e-45),
+    ("Newton sem df com f do módulo math", newton_sem_dual, [1], 0),
+    ("cache em disco", cache_em_disco, [1, 1, 1, 1, 1], 0),
+    ("armazenamento .npy em fluxo", armazenamento_em_disco, [1, 2, 3, 4, 5, 0, 0, 0, 3, 4, 5, 5], 0),
+    ("armazenamento colunas irregulares", historicos_em_disco, [3, 0.5, 0.9, 1.0, 0, 2.5, 3.0, 2], 0),
+]
+
+
+def conferir(caso):
+    nome, chamada, raiz, erro, aceitos, teto = caso
+    try:
+        r = chamada()
+    except Exception as erro_chamada:
+        return [f"exceção {erro_chamada!r}"]
+    problemas = []
+    if r.status not in aceitos:
+        problemas.append(f"status {NOMES_STATUS[r.status]}")
+    if raiz is not None and not abs(float(r.raiz) - raiz) <= erro:
+        problemas.append(f"raiz {float(r.raiz)!r} (esperada {raiz})")
+    if r.iteracoes > teto:
+        problemas.append(f"{r.iteracoes} iterações (teto {teto})")
+    return problemas
+
+
+def conferir_lote(caso):
+    nome, chamada, raizes, erro, aceitos, teto = caso
+    try:
+        r, iteracoes, status = chamada()
+    except Exception as erro_chamada:
+        return [f"exceção {erro_chamada!r}"]
+    problemas = []
+    if not np.isin(status, aceitos).all():
+        problemas.append(f"status {[NOMES_STATUS[s] for s in status.tolist()]}")
+    if raizes is not None and not np.allclose(np.asarray(r, dtype=np.float64), raizes, rtol=0, atol=erro):
+        problemas.append(f"raízes {np.asarray(r, dtype=np.float64).tolist()} (esperadas {raizes})")
+    if iteracoes.max() > teto:
+        problemas.append(f"{iteracoes.max()} iterações (teto {teto})")
+    return problemas
+
+
+def conferir_valor(caso):
+    nome, chamada, esperado, erro = caso
+    try:
+        valor = np.asarray(chamada(), dtype=np.float64)
+    except Exception as erro_chamada:
+        return [f"exceção {erro_chamada!r}"]
+    if valor.shape != np.shape(esperado) or not np.allclose(valor, esperado, rtol=0, atol=erro):
+        return [f"valor {valor.tolist()} (esperado {esperado})"]
+    return []
+
+
+def conferir_busca(caso):
+    nome, f, a, b, esperadas, pontos = caso
+    try:
+        raizes = encontrar_raizes(f, a, b, pontos)
+    except Exception as erro_chamada:
+        return [f"exceção {erro_chamada!r}"]
+    if len(raizes) != len(esperadas) or not np.allclose(raizes, esperadas, rtol=0, atol=1e-6):
+        return [f"raízes {raizes.tolist()} (esperadas {esperadas})"]
+    return []
+
+
+def executar():
+    casos = ([(caso, conferir) for caso in CASOS] + [(caso, conferir_lote) for caso in CASOS_LOTE]
+             + [(caso, conferir_busca) for caso in CASOS_BUSCA] + [(caso, conferir_valor) for caso in CASOS_VALORES])
+    falhas = 0
+    for caso, conferir_caso in casos:
+        problemas = conferir_caso(caso)
+        if problemas:
+            falhas += 1
+            print(f"  FALHOU  {caso[0]}: " + "; ".join(problemas))
+    print(f"  {len(casos) - falhas}/{len(casos)} casos ok")
+    return falhas
+
+
+if __name__ == "__main__":
+    sys.exit(1 if executar() else 0)